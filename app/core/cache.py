@@ -0,0 +1,182 @@
+# app/core/cache.py
+
+"""
+Bounded in-process TTL/LRU cache with pluggable cross-worker invalidation.
+
+Each worker keeps its own `TTLCache`. Writes invalidate the local entry
+immediately and publish the key through an `InvalidationBackend`; other
+workers pick published keys up at most every `sync_interval` seconds, so an
+entry is never served stale for longer than that (and never past its TTL).
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+from app.core.config import settings
+
+
+class InvalidationBackend:
+    """
+    Shares invalidated keys between workers.
+
+    The base class is the single-process backend: nothing to share.
+    """
+
+    def publish(self, key: Hashable) -> None:
+        pass
+
+    def fetch(self) -> List[str]:
+        """Return keys invalidated by any worker since the last call."""
+        return []
+
+
+class SQLiteInvalidationBackend(InvalidationBackend):
+    """
+    Invalidation log stored in a local SQLite file.
+
+    Stands in for a shared store such as Redis when several workers run on one
+    host. Only entries newer than the log position at startup are replayed,
+    and entries older than `retention` seconds are pruned on publish.
+    """
+
+    def __init__(self, path: str, retention: float = 3600.0):
+        self.retention = retention
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_invalidations ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, cache_key TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        row = self._conn.execute("SELECT MAX(id) FROM cache_invalidations").fetchone()
+        self._last_id = row[0] or 0
+
+    def publish(self, key: Hashable) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO cache_invalidations (cache_key, created) VALUES (?, ?)", (str(key), now)
+            )
+            self._conn.execute(
+                "DELETE FROM cache_invalidations WHERE created < ?", (now - self.retention,)
+            )
+
+    def fetch(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, cache_key FROM cache_invalidations WHERE id > ? ORDER BY id",
+                (self._last_id,),
+            ).fetchall()
+            if rows:
+                self._last_id = rows[-1][0]
+        return [key for _, key in rows]
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after `ttl` seconds.
+
+    Keeps `hits`, `misses` and `evictions` counters (entries pushed out by
+    the size bound; expired entries are counted in `expirations`).
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        backend: Optional[InvalidationBackend] = None,
+        sync_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.backend = backend or InvalidationBackend()
+        self.sync_interval = sync_interval
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._next_sync = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        self._sync()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop `key` here and tell the other workers to drop it too."""
+        with self._lock:
+            self._data.pop(key, None)
+        self.backend.publish(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _sync(self) -> None:
+        """Apply invalidations published by other workers, at most every `sync_interval`."""
+        now = self._clock()
+        if now < self._next_sync:
+            return
+        self._next_sync = now + self.sync_interval
+        keys = self.backend.fetch()
+        if not keys:
+            return
+        with self._lock:
+            # Keys round-trip through the backend as strings.
+            stale = {str(k) for k in keys}
+            for key in [k for k in self._data if str(k) in stale]:
+                del self._data[key]
+
+
+def _build_backend() -> InvalidationBackend:
+    if settings.USER_CACHE_BACKEND == "sqlite":
+        return SQLiteInvalidationBackend(settings.USER_CACHE_SQLITE_PATH)
+    return InvalidationBackend()
+
+
+# Authenticated-user cache used by `get_current_user`, keyed by user_id.
+user_cache = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+    backend=_build_backend(),
+    sync_interval=settings.USER_CACHE_SYNC_INTERVAL,
+)
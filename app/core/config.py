@@ -14,6 +14,14 @@ class Settings:
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
+    # Password hashing. BCRYPT_ROUNDS is the cost for new hashes; stored hashes
+    # with another cost are re-hashed on the next successful login.
+    # HASH_WORKERS=0 hashes inline in the calling thread (tests, local dev).
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    HASH_WORKERS = int(os.getenv("HASH_WORKERS", str(os.cpu_count() or 1)))
+    HASH_QUEUE_SIZE = int(os.getenv("HASH_QUEUE_SIZE", str(2 * (os.cpu_count() or 1))))
+    HASH_TIMEOUT = float(os.getenv("HASH_TIMEOUT", "10"))
+
     # DB Config
     DB_USER = os.getenv("DB_USER", "notesuser")
     DB_PASS = os.getenv("DB_PASS", "notespass")
@@ -22,4 +30,47 @@ class Settings:
     DB_NAME = os.getenv("DB_NAME", "notesdb")
     DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
 
+    # Async DB Config (set DB_ASYNC=true to serve notes through AsyncSession).
+    # Use sqlite+aiosqlite:///./notes.db for local runs without MySQL.
+    DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() == "true"
+    ASYNC_DATABASE_URL = os.getenv(
+        "ASYNC_DATABASE_URL",
+        f"mysql+aiomysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+    )
+
+    # Read replicas: comma-separated SQLAlchemy URLs (empty = primary only).
+    # GET/HEAD requests read from a replica picked by DB_REPLICA_STRATEGY
+    # ("round_robin" or "least_connections"); a replica whose connection fails
+    # is skipped for DB_REPLICA_EJECT_SECONDS. Users read from the primary for
+    # DB_READ_YOUR_WRITES_SECONDS after they write.
+    DB_REPLICA_URLS = [u.strip() for u in os.getenv("DB_REPLICA_URLS", "").split(",") if u.strip()]
+    DB_REPLICA_STRATEGY = os.getenv("DB_REPLICA_STRATEGY", "round_robin")
+    DB_REPLICA_EJECT_SECONDS = float(os.getenv("DB_REPLICA_EJECT_SECONDS", "30"))
+    DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+
+    # Authenticated-user cache (USER_CACHE_SIZE=0 disables it).
+    # USER_CACHE_BACKEND=sqlite shares invalidations between workers on one host.
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "60"))
+    USER_CACHE_SYNC_INTERVAL = float(os.getenv("USER_CACHE_SYNC_INTERVAL", "1"))
+    USER_CACHE_BACKEND = os.getenv("USER_CACHE_BACKEND", "local")
+    USER_CACHE_SQLITE_PATH = os.getenv("USER_CACHE_SQLITE_PATH", "/tmp/notesapp-cache.sqlite3")
+
+    # Note search: "memory" (per-process inverted index) or "database"
+    # (MySQL FULLTEXT / SQLite FTS5).
+    SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "memory")
+    SEARCH_INDEX_TTL = float(os.getenv("SEARCH_INDEX_TTL", "300"))
+    SEARCH_INDEX_MAX_USERS = int(os.getenv("SEARCH_INDEX_MAX_USERS", "1000"))
+
+    # Maximum number of create+update+delete items in POST /api/notes/bulk
+    BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "500"))
+
+    # POST /api/notes/import: rows per transaction and errors listed in the summary
+    IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+    IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "100"))
+
+    # Pagination
+    DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "20"))
+    MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "100"))
+
 settings = Settings()
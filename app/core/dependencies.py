@@ -1,24 +1,44 @@
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
-from app.db import SessionLocal
+from starlette.concurrency import run_in_threadpool
+from app.db import SessionLocal, AsyncSessionLocal
 from app.models import User
 from fastapi.security import OAuth2PasswordBearer
+from app.core.cache import user_cache
+from app.core.config import settings
 from app.core.security import verify_access_token
-from app.repositories.user_repository import UserRepository
+from app.repositories.user_repository import UserRepository, AsyncUserRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
-def get_db():
+# Requests that may be served from a read replica (see app/core/replicas.py).
+READ_ONLY_METHODS = {"GET", "HEAD"}
+
+def get_db(request: Request):
     db = SessionLocal()
+    # The user is set on request.state by get_current_user.
+    db.set_acting_user(lambda: getattr(request.state, "user_id", None))
+    if request.method in READ_ONLY_METHODS:
+        db.allow_replica_reads()
     try:
         yield db
     finally:
         db.close()
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_async_db():
+    """
+    Yield an `AsyncSession` (requires DB_ASYNC=true).
     """
-    Extract user from JWT token (synchronous).
+    async with AsyncSessionLocal() as db:
+        yield db
 
+async def get_current_user(request: Request, token: str = Depends(oauth2_scheme)):
+    """
+    Extract user from JWT token.
+
+    The user is served from `user_cache` when possible. On a miss it is
+    loaded with the async user repository when DB_ASYNC is enabled, otherwise
+    the sync lookup runs in the threadpool so the event loop is never blocked.
     Raises 401 if token is invalid or user not found.
     """
     payload = verify_access_token(token)
@@ -27,12 +47,21 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                             detail="Invalid authentication token")
+    request.state.user_id = user_id
+
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
 
-    user_repo = UserRepository()
-    user = user_repo.get_by_id(user_id)  # sync call
+    if settings.DB_ASYNC:
+        user = await AsyncUserRepository().get_by_id(user_id)
+    else:
+        user = await run_in_threadpool(UserRepository().get_by_id, user_id)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED,
                             detail="User not found")
 
+    user_cache.set(user_id, user)
+
     return user
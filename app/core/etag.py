@@ -0,0 +1,61 @@
+# app/core/etag.py
+
+"""
+Helpers for strong ETags and the conditional request headers
+(If-None-Match on reads, If-Match on writes).
+"""
+
+import hashlib
+import re
+from typing import Optional, Set
+
+
+def make_etag(*parts) -> str:
+    """Build a quoted strong ETag from the given parts."""
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()[:24]
+    return f'"{digest}"'
+
+
+def version_etag(resource_id, version: int) -> str:
+    """
+    Strong ETag for a versioned row. The version is readable from the tag, so
+    an If-Match precondition can be checked by the write statement itself.
+    """
+    return f'"{resource_id}-v{version}"'
+
+
+def _tags(header: str):
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def none_match(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    True if an If-None-Match header matches `etag`, i.e. the client's copy is
+    current and a 304 can be returned. Uses weak comparison (RFC 9110 13.1.2).
+    """
+    if not if_none_match:
+        return False
+    for tag in _tags(if_none_match):
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def if_match_versions(if_match: Optional[str], resource_id) -> Optional[Set[int]]:
+    """
+    Versions of `resource_id` that an If-Match header accepts, for tags made
+    by `version_etag`. None means any version (no header, or "*"); tags that
+    cannot match (weak, other resources, other formats) are ignored, so the
+    set may be empty.
+    """
+    if if_match is None:
+        return None
+    pattern = re.compile(rf'^"{re.escape(str(resource_id))}-v(\d+)"$')
+    versions = set()
+    for tag in _tags(if_match):
+        if tag == "*":
+            return None
+        found = pattern.match(tag)
+        if found:
+            versions.add(int(found.group(1)))
+    return versions
@@ -0,0 +1,72 @@
+# app/core/hashing.py
+
+"""
+Bounded process pool for password hashing.
+
+bcrypt is deliberately slow and holds the GIL while it runs, so hashing in
+the request thread lets a burst of logins starve every other request in the
+worker. `HashingExecutor` runs the work in separate processes and caps how
+many jobs may be queued or running; once the cap is reached `submit` fails
+immediately with `HashingQueueFull` (mapped to 503) instead of piling up.
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+
+
+class HashingQueueFull(RuntimeError):
+    """Raised when the hashing executor already has `queue_size` jobs in flight."""
+
+
+class HashingExecutor:
+    def __init__(self, workers: int, queue_size: int, timeout: float):
+        self.workers = workers
+        self.queue_size = max(queue_size, 1)
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.queue_size)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # Created on first use so importing the app never spawns processes.
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        # spawn: forking a threaded server process is unsafe
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._pool
+
+    def submit(self, fn, *args) -> Future:
+        """
+        Schedule `fn(*args)`; raise HashingQueueFull rather than wait for a slot.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HashingQueueFull("Password hashing queue is full")
+        try:
+            if self.workers <= 0:
+                future = Future()
+                try:
+                    future.set_result(fn(*args))
+                except Exception as exc:
+                    future.set_exception(exc)
+            else:
+                future = self._get_pool().submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        """Submit `fn(*args)` and block the calling thread until it finishes."""
+        return self.submit(fn, *args).result(timeout=self.timeout)
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
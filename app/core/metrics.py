@@ -0,0 +1,172 @@
+# app/core/metrics.py
+
+"""
+Prometheus metrics: HTTP latency per route template, SQL statement timing and
+connection-pool state.
+
+With several workers (uvicorn --workers / gunicorn), point
+PROMETHEUS_MULTIPROC_DIR at an empty directory shared by the workers before
+they start. Each worker then writes its samples to memory-mapped files there
+and `GET /api/metrics` aggregates all of them, whichever worker serves the
+scrape. Without it, metrics are kept in process memory.
+"""
+
+import os
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool.impl import AsyncAdaptedQueuePool
+
+MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+# Latency buckets in seconds; SQL statements are expected to be much faster
+# than whole requests.
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ["method", "route"],
+    buckets=HTTP_BUCKETS,
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by engine and statement type.",
+    ["engine", "operation"],
+    buckets=DB_BUCKETS,
+)
+# "livesum" adds up the values of the workers that are still running.
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool.",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is filling up).",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a connection from the pool.",
+    ["engine"],
+    buckets=DB_BUCKETS,
+)
+
+# Route label for requests that matched no route (404s, scanners), so that
+# arbitrary paths cannot blow up the number of series.
+UNMATCHED_ROUTE = "<unmatched>"
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
+
+def observe_request(method: str, route: str, status: int, duration: float) -> None:
+    HTTP_REQUESTS.labels(method, route, str(status)).inc()
+    HTTP_LATENCY.labels(method, route).observe(duration)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Return the exposition body and its content type."""
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multi-process aggregate."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+# ------------------------------------------------------------------------------
+# SQLAlchemy instrumentation
+# ------------------------------------------------------------------------------
+def _operation(statement: str) -> str:
+    verb = statement.lstrip()[:6].upper()
+    return verb if verb in _OPERATIONS else "OTHER"
+
+
+class _TimedGetMixin:
+    """Pool mixin that times how long a checkout waits for a connection."""
+
+    metrics_name = "default"
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.labels(self.metrics_name).observe(time.perf_counter() - start)
+
+
+class TimedQueuePool(_TimedGetMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedGetMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_engine(engine, name: str = "default") -> None:
+    """
+    Record statement timings and pool gauges for `engine` (a sync Engine;
+    pass `async_engine.sync_engine` for an AsyncEngine). Safe to call twice.
+    """
+    if getattr(engine, "_metrics_name", None):
+        return
+    engine._metrics_name = name
+    pool = engine.pool
+    if isinstance(pool, _TimedGetMixin):
+        pool.metrics_name = name
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    overflow = DB_POOL_OVERFLOW.labels(name)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        DB_QUERY_LATENCY.labels(name, _operation(statement)).observe(time.perf_counter() - started)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # after_cursor_execute does not run for failed statements.
+        conn = context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+    @event.listens_for(pool, "checkout")
+    def _checkout(dbapi_conn, record, proxy):
+        checked_out.inc()
+        if hasattr(pool, "overflow"):
+            overflow.set(pool.overflow())
+
+    @event.listens_for(pool, "checkin")
+    def _checkin(dbapi_conn, record):
+        checked_out.dec()
+        if hasattr(pool, "overflow"):
+            overflow.set(pool.overflow())
@@ -0,0 +1,161 @@
+# app/core/replicas.py
+
+"""
+Read-replica routing.
+
+`ReplicaRouter` picks a replica engine per session, round-robin or by fewest
+checked-out connections, and ejects a replica for `eject_seconds` after a
+connection to it fails. `RoutingSession` sends SELECTs to that replica once
+replica reads have been allowed for it (read-only requests), and everything
+else, and every statement after the session's first write, to the primary.
+
+Read-your-writes: a write records the user in `recent_writers`, and their
+reads stay on the primary for DB_READ_YOUR_WRITES_SECONDS so replication lag
+never hides their own changes. The window is tracked per worker process.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+STRATEGIES = ("round_robin", "least_connections")
+
+# user_id -> True for users who wrote within the read-your-writes window.
+recent_writers = TTLCache(maxsize=100_000, ttl=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+
+class ReplicaRouter:
+    def __init__(
+        self,
+        engines: List,
+        strategy: str = "round_robin",
+        eject_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown replica strategy: {strategy!r}")
+        self.engines = list(engines)
+        self.strategy = strategy
+        self.eject_seconds = eject_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rotation = itertools.cycle(range(len(self.engines)))
+        self._in_use = {id(e): 0 for e in self.engines}
+        self._ejected_until = {}
+        for engine in self.engines:
+            self._watch(engine)
+
+    def _watch(self, engine) -> None:
+        key = id(engine)
+
+        @event.listens_for(engine.pool, "checkout")
+        def _checkout(dbapi_conn, record, proxy):
+            with self._lock:
+                self._in_use[key] += 1
+
+        @event.listens_for(engine.pool, "checkin")
+        def _checkin(dbapi_conn, record):
+            with self._lock:
+                self._in_use[key] -= 1
+
+        @event.listens_for(engine, "handle_error")
+        def _error(context):
+            # Lost connections and failed connects (no connection yet) mean the
+            # replica is unhealthy; plain SQL errors do not.
+            if context.is_disconnect or context.connection is None:
+                self.eject(engine)
+
+    def healthy(self) -> List:
+        now = self._clock()
+        with self._lock:
+            return [e for e in self.engines if self._ejected_until.get(id(e), 0) <= now]
+
+    def eject(self, engine) -> None:
+        with self._lock:
+            self._ejected_until[id(engine)] = self._clock() + self.eject_seconds
+        logger.warning(f"Replica {engine.url!r} ejected for {self.eject_seconds}s")
+
+    def in_use(self, engine) -> int:
+        with self._lock:
+            return self._in_use[id(engine)]
+
+    def choose(self):
+        """Return a healthy replica engine, or None to read from the primary."""
+        healthy = self.healthy()
+        if not healthy:
+            return None
+        if self.strategy == "least_connections":
+            with self._lock:
+                return min(healthy, key=lambda e: self._in_use[id(e)])
+        healthy_ids = {id(e) for e in healthy}
+        with self._lock:
+            for _ in range(len(self.engines)):
+                engine = self.engines[next(self._rotation)]
+                if id(engine) in healthy_ids:
+                    return engine
+        return None
+
+
+class RoutingSession(Session):
+    """
+    Session bound to the primary that can read from a replica.
+
+    Replica reads are off until `allow_replica_reads` is called; then SELECTs
+    run on one replica chosen for the whole session, unless the acting user
+    wrote recently. Other statements (including text()) always use the
+    primary. The first write (flush or DML statement) pins the session to the
+    primary and starts the acting user's read-your-writes window.
+    """
+
+    def __init__(self, *args, router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.router = router
+        self._user_id: Callable[[], Optional[int]] = lambda: None
+        self._reads_allowed = False
+        self._pinned = False
+        self._replica = None
+
+    def set_acting_user(self, user_id: Callable[[], Optional[int]]) -> None:
+        """
+        `user_id` returns the user the session works for, or None. It is only
+        called when needed, so it may be resolved by a dependency that runs
+        after the session is created.
+        """
+        self._user_id = user_id
+
+    def allow_replica_reads(self) -> None:
+        self._reads_allowed = self.router is not None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self._wrote()
+        elif getattr(clause, "is_select", False) and self._reads_allowed and not self._pinned:
+            replica = self._choose_replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper, clause, **kw)
+
+    def _choose_replica(self):
+        if self._replica is None:
+            user_id = self._user_id()
+            if user_id is not None and recent_writers.get(user_id):
+                self._pinned = True
+                return None
+            self._replica = self.router.choose()
+        return self._replica
+
+    def _wrote(self) -> None:
+        self._pinned = True
+        user_id = self._user_id()
+        if user_id is not None:
+            recent_writers.set(user_id, True)
@@ -3,23 +3,47 @@ from jose import jwt, JWTError
 import os
 from datetime import datetime, timedelta
 from app.core.config import settings
+from app.core.hashing import HashingExecutor
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+hash_executor = HashingExecutor(
+    workers=settings.HASH_WORKERS,
+    queue_size=settings.HASH_QUEUE_SIZE,
+    timeout=settings.HASH_TIMEOUT,
+)
 SECRET_KEY = os.getenv("SECRET_KEY", "supersecret")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 60))
 
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
 def get_password_hash(password):
     """
-    Hash a plain password using bcrypt.
+    Hash a plain password using bcrypt in the hashing process pool.
+
+    Raises HashingQueueFull if too many hashes are already pending.
     """
-    return pwd_context.hash(password)
+    return hash_executor.run(_hash, password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
-    Verify a plain password against a hashed password.
+    Verify a plain password against a hashed password in the hashing process pool.
+
+    Raises HashingQueueFull if too many hashes are already pending.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return hash_executor.run(_verify, plain_password, hashed_password)
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    True if the stored hash uses another scheme or bcrypt cost than configured.
+    """
+    return pwd_context.needs_update(hashed_password)
 
 def create_access_token(data: dict, expires_delta: int = None):
     to_encode = data.copy()
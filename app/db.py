@@ -1,9 +1,13 @@
 # app/database.py
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
+from app.core.config import settings
+from app.core.metrics import TimedAsyncQueuePool, TimedQueuePool, instrument_engine
+from app.core.replicas import ReplicaRouter, RoutingSession
 
 # Load .env file (works locally)
 load_dotenv()
@@ -14,13 +18,67 @@ DB_HOST = os.getenv("DB_HOST", "127.0.0.1")  # local first, later use "db" in do
 DB_PORT = os.getenv("DB_PORT", "3306")
 DB_NAME = os.getenv("DB_NAME", "notesdb")
 
-DATABASE_URL = f"mysql+mysqlconnector://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+# DATABASE_URL overrides the DB_* settings, e.g. sqlite:///./notes.db for
+# local runs and benchmarks without MySQL.
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"mysql+mysqlconnector://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
+)
+
+
+def _engine_options(url: str) -> dict:
+    if url.startswith("sqlite"):
+        # Connections are shared across the threadpool; keep SQLite's default pool.
+        return {"connect_args": {"check_same_thread": False}}
+    return {"poolclass": TimedQueuePool}  # QueuePool that records checkout wait time
+
 
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # auto test connections
-    echo=False           # set True for debugging queries
+    echo=False,          # set True for debugging queries
+    **_engine_options(DATABASE_URL),
+)
+instrument_engine(engine, "primary")
+
+# Optional read replicas (see app/core/replicas.py)
+replica_router = None
+if settings.DB_REPLICA_URLS:
+    replica_engines = []
+    for i, url in enumerate(settings.DB_REPLICA_URLS):
+        replica = create_engine(url, pool_pre_ping=True, **_engine_options(url))
+        instrument_engine(replica, f"replica{i}")
+        replica_engines.append(replica)
+    replica_router = ReplicaRouter(
+        replica_engines,
+        strategy=settings.DB_REPLICA_STRATEGY,
+        eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+    )
+
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,  # objects stay usable after commit without a re-SELECT
+    bind=engine,
+    class_=RoutingSession,
+    router=replica_router,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Optional asyncio engine, only built when enabled so the async driver
+# (aiomysql / aiosqlite) is not required for the sync deployment.
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    pool_options = {}
+    if not settings.ASYNC_DATABASE_URL.startswith("sqlite"):
+        # SQLite keeps the dialect's own pool; server databases get the timed one.
+        pool_options["poolclass"] = TimedAsyncQueuePool
+    async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, pool_pre_ping=True, **pool_options)
+    instrument_engine(async_engine.sync_engine, "async")
+    AsyncSessionLocal = sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,  # attributes stay loaded after commit; no lazy IO
+    )
 Base = declarative_base()
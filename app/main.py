@@ -2,16 +2,18 @@
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR, HTTP_503_SERVICE_UNAVAILABLE
 from dotenv import load_dotenv
 import logging
 import time
 
 from app.core.config import settings
+from app.core.hashing import HashingQueueFull
 from app.core.logging import setup_logging
+from app.core.metrics import UNMATCHED_ROUTE, mark_worker_dead, observe_request, render_metrics
+from app.core.security import hash_executor
 from app.routers import auth, notes
 
 # ------------------------------------------------------------------------------
@@ -49,20 +51,42 @@ app.add_middleware(
 
 
 # ------------------------------------------------------------------------------
-# Middleware: Request/Response Logging
-# Logs request method, path, and execution time for observability
+# Middleware: Request/Response Logging and Metrics
+# Logs each request and records its latency and status per route template
+# (e.g. /api/notes/{note_id}). Plain ASGI rather than BaseHTTPMiddleware, so
+# responses are not re-wrapped and streaming bodies pass straight through.
 # ------------------------------------------------------------------------------
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        duration = round(time.time() - start_time, 4)
+class LoggingMiddleware:
+    def __init__(self, app):
+        self.app = app
 
-        logger.info(
-            f"{request.method} {request.url.path} "
-            f"completed_in={duration}s status={response.status_code}"
-        )
-        return response
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500  # reported if the app fails before sending a response
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            # The router stores the matched route in the scope.
+            route = scope.get("route")
+            observe_request(
+                scope["method"], route.path if route else UNMATCHED_ROUTE, status_code, duration
+            )
+            logger.info(
+                f"{scope['method']} {scope['path']} "
+                f"completed_in={round(duration, 4)}s status={status_code}"
+            )
 
 
 app.add_middleware(LoggingMiddleware)
@@ -84,6 +108,20 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+@app.exception_handler(HashingQueueFull)
+async def hashing_queue_full_handler(request: Request, exc: HashingQueueFull):
+    """
+    Fail fast when the password hashing pool is saturated (login/signup storms)
+    instead of queueing requests behind it.
+    """
+    logger.warning(f"Rejected {request.method} {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy. Please retry shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """
@@ -117,6 +155,16 @@ async def health_check():
     return {"status": "ok", "service": "Notes App API"}
 
 
+# ------------------------------------------------------------------------------
+# Metrics Route
+# Prometheus scrape target; aggregates all workers when PROMETHEUS_MULTIPROC_DIR is set
+# ------------------------------------------------------------------------------
+@app.get("/api/metrics", tags=["Health"], include_in_schema=False)
+async def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 # ------------------------------------------------------------------------------
 # Lifecycle Events
 # ------------------------------------------------------------------------------
@@ -142,3 +190,5 @@ async def shutdown_event():
       - Stopping background workers
     """
     logger.info("Application shutdown: Cleaning up resources...")
+    hash_executor.shutdown()
+    mark_worker_dead()
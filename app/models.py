@@ -12,10 +12,35 @@ Best practices followed:
 - Clear separation of concerns (models only contain schema definitions)
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Index, DDL, event
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql import func
 from .db import Base
 
+# MySQL DATETIME keeps whole seconds. SQLite timestamps are stored the same way
+# so values bound from Python compare equal to CURRENT_TIMESTAMP defaults
+# (keyset pagination relies on equality over `created_on`).
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d "
+        "%(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time at the stored (whole-second) precision.
+
+    Timestamps are generated in Python so an INSERT/UPDATE already knows the
+    values it wrote and never has to read the row back for them. The
+    server-side defaults only apply to rows written outside the app.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
 
 class User(Base):
     """
@@ -37,10 +62,10 @@ class User(Base):
     user_email = Column(String(100), unique=True, nullable=False, index=True)
     password = Column(String(255), nullable=False)
     created_on = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        Timestamp, default=utcnow, server_default=func.now(), nullable=False
     )
     last_update = Column(
-        DateTime(timezone=True), onupdate=func.now()
+        Timestamp, onupdate=utcnow
     )
 
 
@@ -55,9 +80,20 @@ class Note(Base):
         user_id (int): Foreign key reference to the `users` table.
         created_on (datetime): Timestamp when the note was created.
         last_update (datetime): Timestamp of the most recent update.
+        version (int): Incremented on every update; used for ETags and
+            optimistic concurrency (SQLAlchemy `version_id_col`).
+
+    The composite index on (user_id, created_on, note_id) matches the
+    keyset pagination order used when listing a user's notes. The
+    (user_id, last_update, created_on, version) index covers the aggregate
+    behind the list ETag, so it never touches the table rows.
     """
 
     __tablename__ = "notes"
+    __table_args__ = (
+        Index("ix_notes_user_created_id", "user_id", "created_on", "note_id"),
+        Index("ix_notes_user_changes", "user_id", "last_update", "created_on", "version"),
+    )
 
     note_id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -66,8 +102,42 @@ class Note(Base):
         Integer, ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False
     )
     created_on = Column(
-        DateTime(timezone=True), server_default=func.now(), nullable=False
+        Timestamp, default=utcnow, server_default=func.now(), nullable=False
     )
     last_update = Column(
-        DateTime(timezone=True), onupdate=func.now()
-    )
\ No newline at end of file
+        Timestamp, onupdate=utcnow
+    )
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
+
+
+# ------------------------------------------------------------------------------
+# Full-text search indexes (used by app.search.database)
+# MySQL gets a FULLTEXT index on (title, body). SQLite gets an external-content
+# FTS5 table kept in sync with `notes` by triggers.
+# ------------------------------------------------------------------------------
+event.listen(
+    Note.__table__,
+    "after_create",
+    DDL("CREATE FULLTEXT INDEX ft_notes_title_body ON notes (title, body)").execute_if(dialect="mysql"),
+)
+
+for _statement in (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5("
+    "title, body, content='notes', content_rowid='note_id')",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_ai AFTER INSERT ON notes BEGIN "
+    "INSERT INTO notes_fts(rowid, title, body) VALUES (new.note_id, new.title, new.body); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_ad AFTER DELETE ON notes BEGIN "
+    "INSERT INTO notes_fts(notes_fts, rowid, title, body) VALUES ('delete', old.note_id, old.title, old.body); END",
+    "CREATE TRIGGER IF NOT EXISTS notes_fts_au AFTER UPDATE ON notes BEGIN "
+    "INSERT INTO notes_fts(notes_fts, rowid, title, body) VALUES ('delete', old.note_id, old.title, old.body); "
+    "INSERT INTO notes_fts(rowid, title, body) VALUES (new.note_id, new.title, new.body); END",
+):
+    event.listen(Note.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+
+event.listen(
+    Note.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS notes_fts").execute_if(dialect="sqlite"),
+)
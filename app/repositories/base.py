@@ -1,5 +1,6 @@
+from sqlalchemy import bindparam, delete, insert, inspect, select, update
 from sqlalchemy.orm import Session
-from typing import Generic, Type, TypeVar
+from typing import Any, Generic, Iterable, List, Type, TypeVar
 
 T = TypeVar("T")  # SQLAlchemy model type
 
@@ -9,8 +10,13 @@ class BaseRepository(Generic[T]):
     def __init__(self, model: Type[T]):
         self.model = model
 
+    @property
+    def pk(self):
+        """Primary key column of the model (single-column keys only)."""
+        return inspect(self.model).primary_key[0]
+
     def get(self, db: Session, id: int) -> T | None:
-        return db.query(self.model).filter(self.model.id == id).first()
+        return db.query(self.model).filter(self.pk == id).first()
 
     def list(self, db: Session) -> list[T]:
         return db.query(self.model).all()
@@ -32,3 +38,80 @@ class BaseRepository(Generic[T]):
     def delete(self, db: Session, obj: T):
         db.delete(obj)
         db.commit()
+
+    # ---------------------------
+    # BULK
+    # The bulk primitives never commit: callers group them into one
+    # transaction and commit (or roll back) once.
+    # `scope` is an optional {column: value} filter, e.g. {"user_id": 1},
+    # so rows outside the caller's ownership are never touched.
+    # ---------------------------
+    def _scoped(self, stmt, scope: dict | None):
+        for column, value in (scope or {}).items():
+            stmt = stmt.where(getattr(self.model, column) == value)
+        return stmt
+
+    def bulk_insert(self, db: Session, rows: List[dict]) -> int:
+        """
+        Insert `rows` with a single executemany INSERT (sent as one multi-row
+        INSERT by the MySQL drivers). Generated keys are not returned.
+        """
+        if not rows:
+            return 0
+        db.execute(insert(self.model.__table__), rows)
+        return len(rows)
+
+    def bulk_create(self, db: Session, rows: List[dict]) -> List[T]:
+        """
+        Add `rows` as ORM objects and flush once so their primary keys are set.
+        """
+        objs = [self.model(**row) for row in rows]
+        db.add_all(objs)
+        db.flush()
+        return objs
+
+    def existing_ids(self, db: Session, ids: Iterable[Any], scope: dict | None = None) -> set:
+        """Return which of `ids` exist (within `scope`) in one query."""
+        ids = set(ids)
+        if not ids:
+            return set()
+        stmt = self._scoped(select(self.pk).where(self.pk.in_(ids)), scope)
+        return set(db.execute(stmt).scalars())
+
+    def bulk_update(self, db: Session, rows: List[dict], scope: dict | None = None) -> int:
+        """
+        Update rows identified by their primary key with executemany UPDATEs.
+
+        Rows are grouped by the set of columns they change, so each group is a
+        single statement executed with many parameter sets.
+        """
+        pk = self.pk.key
+        groups: dict[tuple, List[dict]] = {}
+        for row in rows:
+            columns = tuple(sorted(k for k in row if k != pk))
+            if columns:
+                groups.setdefault(columns, []).append(row)
+
+        # Keep optimistic-locking counters (mapper `version_id_col`) moving.
+        version_col = inspect(self.model).version_id_col
+        bump = {version_col.name: version_col + 1} if version_col is not None else {}
+
+        updated = 0
+        for columns, group in groups.items():
+            stmt = (
+                update(self.model.__table__)
+                .where(self.pk == bindparam("_pk"))
+                .values({**{c: bindparam(f"_{c}") for c in columns}, **bump})
+            )
+            stmt = self._scoped(stmt, scope)
+            params = [{"_pk": row[pk], **{f"_{c}": row[c] for c in columns}} for row in group]
+            updated += db.execute(stmt, params).rowcount
+        return updated
+
+    def bulk_delete(self, db: Session, ids: Iterable[Any], scope: dict | None = None) -> int:
+        """Delete all rows whose primary key is in `ids` with one DELETE."""
+        ids = set(ids)
+        if not ids:
+            return 0
+        stmt = self._scoped(delete(self.model.__table__).where(self.pk.in_(ids)), scope)
+        return db.execute(stmt).rowcount
@@ -1,12 +1,40 @@
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from app.models import Note
-from app.schemas import NoteCreate, NoteUpdate
-from typing import Optional, List
+from app.schemas import NoteBulkRequest, NoteCreate, NoteUpdate
+from app.repositories.base import BaseRepository
+from app.repositories.pagination import Page, keyset, paginate, to_page
+from app.core.config import settings
+from app.search import SearchHit, search_backend
+from typing import AsyncIterator, Collection, Iterator, List, Optional
 
-class NoteRepository:
+class VersionConflict(Exception):
+    """The note changed since the version the caller expected (If-Match)."""
+
+
+# Cheap aggregate that changes whenever any of a user's notes is created,
+# updated or deleted; served from the ix_notes_user_changes covering index.
+def _fingerprint_columns():
+    return (
+        func.count(Note.note_id),
+        func.coalesce(func.sum(Note.version), 0),
+        func.max(func.coalesce(Note.last_update, Note.created_on)),
+    )
+
+
+# Columns serialised by the export endpoint (the `NoteOut` fields).
+EXPORT_COLUMNS = (
+    Note.note_id, Note.title, Note.body, Note.user_id, Note.created_on, Note.last_update
+)
+
+
+class NoteRepository(BaseRepository[Note]):
     def __init__(self, db: Session):
+        super().__init__(Note)
         self.db = db
-        
+
     """
     Repository layer for Note model.
     Encapsulates all DB operations for notes.
@@ -22,47 +50,374 @@ class NoteRepository:
             user_id=user_id
         )
         self.db.add(note)
+        # Timestamps and version are set client-side and the key comes back
+        # with the INSERT, so the note is complete without a refresh.
         self.db.commit()
-        self.db.refresh(note)
+        search_backend.note_saved(note)
         return note
 
     # ---------------------------
     # READ
     # ---------------------------
-    def get_by_id(self, db: Session, note_id: int) -> Optional[Note]:
-        return db.query(Note).filter(Note.note_id == note_id).first()
+    def get_by_id(self, note_id: int) -> Optional[Note]:
+        return self.db.query(Note).filter(Note.note_id == note_id).first()
+
+    def get_version(self, note_id: int) -> Optional[int]:
+        """Current version of a note without loading its body (None if missing)."""
+        return self.db.query(Note.version).filter(Note.note_id == note_id).scalar()
+
+    def list_fingerprint(self, user_id: int) -> tuple:
+        """(count, sum of versions, latest change) over the user's notes."""
+        return tuple(self.db.query(*_fingerprint_columns()).filter(Note.user_id == user_id).one())
+
+    def list_by_user(
+        self,
+        user_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[Note]:
+        """
+        Fetch one page of a user's notes, newest first.
 
-    def list_by_user(self, db: Session, user_id: int) -> List[Note]:
-        return db.query(Note).filter(Note.user_id == user_id).order_by(Note.created_on.desc()).all()
+        Walks the (user_id, created_on, note_id) index with a keyset cursor,
+        so every page costs the same regardless of how many notes precede it.
+        """
+        query = self.db.query(Note).filter(Note.user_id == user_id)
+        return paginate(
+            query, [Note.created_on, Note.note_id], limit, cursor, descending=True
+        )
+
+    def iter_export(self, user_id: int, batch_size: int = 1000) -> Iterator[List]:
+        """
+        Yield the user's notes in batches of column rows, ordered by note_id.
+
+        Rows are read through a server-side cursor (`yield_per` enables
+        `stream_results`), so memory stays bounded by `batch_size`.
+        """
+        query = (
+            self.db.query(*EXPORT_COLUMNS)
+            .filter(Note.user_id == user_id)
+            .order_by(Note.note_id)
+            .yield_per(batch_size)
+        )
+        batch = []
+        for row in query:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def search(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[SearchHit]:
+        """
+        Full-text search over the user's note titles and bodies, best match first.
+        """
+        return search_backend.search(self.db, user_id, query, limit, cursor)
 
-    def get_all(self):
-        """Fetch all notes"""
-        return self.db.query(Note).all()
     # ---------------------------
     # UPDATE
     # ---------------------------
-    def update(self, note_id: int, note_update: NoteUpdate) -> Note:
-        note = self.db.query(Note).filter(Note.note_id == note_id).first()
-        if not note:
-            return None
+    def update(
+        self,
+        note_id: int,
+        user_id: int,
+        note_update: NoteUpdate,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> Optional[Note]:
+        """
+        Update the user's note with one `UPDATE ... WHERE note_id AND user_id`
+        (plus `version IN expected_versions` for If-Match) and return it.
+
+        The updated row comes back through RETURNING where the dialect
+        supports it, otherwise with one SELECT in the same transaction.
+        Returns None if the user has no such note; raises VersionConflict if
+        it exists with another version.
+        """
+        values = {}
         if note_update.title:
-            note.title = note_update.title
+            values["title"] = note_update.title
         if note_update.body:
-            note.body = note_update.body
+            values["body"] = note_update.body
+
+        if not values:
+            # Nothing to change: no write, no version bump.
+            note = self.db.execute(
+                self._owned(select(Note), note_id, user_id, expected_versions)
+            ).scalar()
+        else:
+            stmt = (
+                self._owned(update(Note), note_id, user_id, expected_versions)
+                .values(**values, version=Note.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if self._returning:
+                note = self.db.execute(
+                    select(Note).from_statement(stmt.returning(*Note.__table__.c))
+                    .execution_options(populate_existing=True)
+                ).scalar()
+            elif self.db.execute(stmt).rowcount:
+                note = self.db.execute(
+                    select(Note).where(Note.note_id == note_id)
+                    .execution_options(populate_existing=True)
+                ).scalar()
+            else:
+                note = None
+
+        if note is None:
+            # Nothing was written; end the transaction without expiring the session.
+            self.db.commit()
+            self._raise_if_conflict(note_id, user_id, expected_versions)
+            return None
         self.db.commit()
-        self.db.refresh(note)
+        if values:
+            search_backend.note_saved(note)
         return note
 
+    # ---------------------------
+    # BULK
+    # ---------------------------
+    def bulk(self, user_id: int, batch: NoteBulkRequest) -> List[dict]:
+        """
+        Apply a batch of creates, updates and deletes in one transaction.
+
+        Only the user's own notes can be updated or deleted; other ids are
+        reported as `not_found`. Operations run in the order creates, updates,
+        deletes. Returns one result per item, in that order.
+        """
+        scope = {"user_id": user_id}
+        owned = self.existing_ids(
+            self.db, [u.note_id for u in batch.update] + list(batch.delete), scope
+        )
+
+        update_rows = []
+        for item in batch.update:
+            if item.note_id not in owned:
+                continue
+            # Same semantics as `update`: empty fields are left unchanged.
+            row = {"note_id": item.note_id}
+            if item.title:
+                row["title"] = item.title
+            if item.body:
+                row["body"] = item.body
+            update_rows.append(row)
+        delete_ids = [note_id for note_id in batch.delete if note_id in owned]
+
+        try:
+            created = self.bulk_create(
+                self.db,
+                [{"title": c.title, "body": c.body, "user_id": user_id} for c in batch.create],
+            )
+            self.bulk_update(self.db, update_rows, scope)
+            self.bulk_delete(self.db, delete_ids, scope)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # One SELECT returns every written note with its server-side timestamps.
+        fresh_ids = {note.note_id for note in created} | {row["note_id"] for row in update_rows}
+        fresh = {}
+        if fresh_ids:
+            query = self.db.query(Note).filter(Note.note_id.in_(fresh_ids)).populate_existing()
+            fresh = {note.note_id: note for note in query}
+        for note in fresh.values():
+            search_backend.note_saved(note)
+        for note_id in set(delete_ids):
+            search_backend.note_deleted(note_id, user_id)
+
+        results = [
+            {"op": "create", "index": i, "note_id": note.note_id, "status": "ok",
+             "note": fresh.get(note.note_id)}
+            for i, note in enumerate(created)
+        ]
+        results += [
+            {"op": "update", "index": i, "note_id": item.note_id,
+             "status": "ok" if item.note_id in owned else "not_found",
+             "note": fresh.get(item.note_id)}
+            for i, item in enumerate(batch.update)
+        ]
+        results += [
+            {"op": "delete", "index": i, "note_id": note_id,
+             "status": "ok" if note_id in owned else "not_found", "note": None}
+            for i, note_id in enumerate(batch.delete)
+        ]
+        return results
+
+    def import_chunk(self, user_id: int, notes: List[NoteCreate]) -> int:
+        """
+        Insert one chunk of imported notes with a multi-row INSERT and commit.
+        """
+        try:
+            self.bulk_insert(
+                self.db, [{"title": n.title, "body": n.body, "user_id": user_id} for n in notes]
+            )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        search_backend.user_changed(user_id)
+        return len(notes)
 
     # ---------------------------
     # DELETE
     # ---------------------------
-    def delete(self, note_id: int) -> bool:
-        # Use the correct primary key column name
-        note = self.db.query(Note).filter(Note.note_id == note_id).first()
-        if not note:
-            return False  # note doesn't exist
-
-        self.db.delete(note)
+    def delete(
+        self, note_id: int, user_id: int, expected_versions: Optional[Collection[int]] = None
+    ) -> bool:
+        """
+        Delete the user's note with one scoped DELETE. Returns False if the
+        user has no such note; raises VersionConflict like `update`.
+        """
+        stmt = self._owned(delete(Note), note_id, user_id, expected_versions)
+        if not self.db.execute(stmt.execution_options(synchronize_session=False)).rowcount:
+            self.db.commit()
+            self._raise_if_conflict(note_id, user_id, expected_versions)
+            return False
         self.db.commit()
+        search_backend.note_deleted(note_id, user_id)
         return True
+
+    # ---------------------------
+    # Single-row writes
+    # ---------------------------
+    @property
+    def _returning(self) -> bool:
+        return self.db.get_bind().dialect.full_returning
+
+    @staticmethod
+    def _owned(stmt, note_id: int, user_id: int, expected_versions: Optional[Collection[int]]):
+        stmt = stmt.where(Note.note_id == note_id, Note.user_id == user_id)
+        if expected_versions is not None:
+            stmt = stmt.where(Note.version.in_(expected_versions))
+        return stmt
+
+    def _raise_if_conflict(
+        self, note_id: int, user_id: int, expected_versions: Optional[Collection[int]]
+    ) -> None:
+        """
+        After a write matched no row: raise VersionConflict if that was only
+        because of the version condition. Costs a query on this path only.
+        """
+        if expected_versions is None:
+            return
+        exists = self.db.scalar(
+            select(Note.version).where(Note.note_id == note_id, Note.user_id == user_id)
+        )
+        if exists is not None:
+            raise VersionConflict(note_id)
+
+
+class AsyncNoteRepository:
+    """
+    Asyncio counterpart of `NoteRepository` backed by an `AsyncSession`.
+    Method names and return values mirror the sync repository.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    # ---------------------------
+    # CREATE
+    # ---------------------------
+    async def create(self, note_create: NoteCreate, user_id: int) -> Note:
+        note = Note(
+            title=note_create.title,
+            body=note_create.body,
+            user_id=user_id
+        )
+        self.db.add(note)
+        await self.db.commit()
+        search_backend.note_saved(note)
+        return note
+
+    # ---------------------------
+    # READ
+    # ---------------------------
+    async def get_by_id(self, note_id: int) -> Optional[Note]:
+        return await self.db.get(Note, note_id)
+
+    async def get_version(self, note_id: int) -> Optional[int]:
+        return await self.db.scalar(select(Note.version).where(Note.note_id == note_id))
+
+    async def list_fingerprint(self, user_id: int) -> tuple:
+        result = await self.db.execute(select(*_fingerprint_columns()).where(Note.user_id == user_id))
+        return tuple(result.one())
+
+    async def list_by_user(
+        self,
+        user_id: int,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[Note]:
+        columns = [Note.created_on, Note.note_id]
+        stmt = keyset(
+            select(Note).where(Note.user_id == user_id), columns, limit, cursor, descending=True
+        )
+        rows = (await self.db.execute(stmt)).scalars().all()
+        return to_page(rows, columns, limit)
+
+    async def iter_export(self, user_id: int, batch_size: int = 1000) -> AsyncIterator[List]:
+        stmt = (
+            select(*EXPORT_COLUMNS)
+            .where(Note.user_id == user_id)
+            .order_by(Note.note_id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(stmt)
+        return result.partitions(batch_size)
+
+    async def search(
+        self,
+        user_id: int,
+        query: str,
+        limit: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[SearchHit]:
+        # Search backends use the sync Session API; run_sync adapts it.
+        return await self.db.run_sync(search_backend.search, user_id, query, limit, cursor)
+
+    # ---------------------------
+    # UPDATE
+    # ---------------------------
+    async def update(
+        self,
+        note_id: int,
+        user_id: int,
+        note_update: NoteUpdate,
+        expected_versions: Optional[Collection[int]] = None,
+    ) -> Optional[Note]:
+        return await self.db.run_sync(
+            lambda session: NoteRepository(session).update(
+                note_id, user_id, note_update, expected_versions
+            )
+        )
+
+    # ---------------------------
+    # BULK
+    # ---------------------------
+    async def bulk(self, user_id: int, batch: NoteBulkRequest) -> List[dict]:
+        return await self.db.run_sync(
+            lambda session: NoteRepository(session).bulk(user_id, batch)
+        )
+
+    async def import_chunk(self, user_id: int, notes: List[NoteCreate]) -> int:
+        return await self.db.run_sync(
+            lambda session: NoteRepository(session).import_chunk(user_id, notes)
+        )
+
+    # ---------------------------
+    # DELETE
+    # ---------------------------
+    async def delete(
+        self, note_id: int, user_id: int, expected_versions: Optional[Collection[int]] = None
+    ) -> bool:
+        return await self.db.run_sync(
+            lambda session: NoteRepository(session).delete(note_id, user_id, expected_versions)
+        )
@@ -0,0 +1,127 @@
+"""
+Keyset (cursor) pagination helpers shared by the repositories.
+
+Instead of ``OFFSET``, each page is fetched with a ``WHERE`` clause that
+continues strictly after the last row of the previous page, so the cost of a
+page does not grow with how deep the client has scrolled. The position is
+handed to the client as an opaque, URL-safe ``next_cursor`` string.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import DateTime, and_, or_
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+
+class Page(Generic[T]):
+    """A single page of results plus the cursor for the following page."""
+
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort-key values of the last row into an opaque cursor.
+    """
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def load_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor` into its raw JSON values.
+
+    Raises ValueError if the cursor is malformed or does not hold `size` values.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid pagination cursor")
+    return values
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor` back into typed values.
+
+    Raises ValueError if the cursor is malformed or does not match `columns`.
+    """
+    values = load_cursor(cursor, len(columns))
+
+    decoded = []
+    for column, value in zip(columns, values):
+        # Dialect variants wrap the underlying type in `impl`.
+        col_type = getattr(column.type, "impl", column.type)
+        if value is not None and isinstance(col_type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as exc:
+                raise ValueError("Invalid pagination cursor") from exc
+        decoded.append(value)
+    return decoded
+
+
+def _after(columns: Sequence[Any], values: Sequence[Any], descending: bool):
+    """
+    Build ``(a, b, c) > (x, y, z)`` (or ``<``) expanded into plain
+    comparisons, which every dialect can match against a composite index.
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        prefix = [columns[j] == values[j] for j in range(i)]
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def keyset(stmt, columns: Sequence[Any], limit: int, cursor: Optional[str] = None, descending: bool = False):
+    """
+    Add the keyset filter, ordering and limit to a `Query` or `select()`.
+
+    `columns` is the full sort key and must end with a unique column so the
+    ordering is total. One extra row is requested so `to_page` can tell
+    whether another page exists without a separate ``COUNT``.
+    """
+    if cursor:
+        stmt = stmt.where(_after(columns, decode_cursor(cursor, columns), descending))
+
+    order = [c.desc() if descending else c.asc() for c in columns]
+    return stmt.order_by(*order).limit(limit + 1)
+
+
+def to_page(rows: List[T], columns: Sequence[Any], limit: int) -> Page[T]:
+    """
+    Trim the look-ahead row fetched by `keyset` and build the next cursor.
+    """
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def paginate(
+    query: Query,
+    columns: Sequence[Any],
+    limit: int,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Page:
+    """
+    Apply keyset pagination to a sync ORM `query` and execute it.
+    """
+    rows = keyset(query, columns, limit, cursor, descending).all()
+    return to_page(rows, columns, limit)
@@ -0,0 +1,23 @@
+from starlette.concurrency import run_in_threadpool
+
+
+class ThreadedRepository:
+    """
+    Wrap a sync repository so its methods can be awaited.
+
+    Each call runs in the anyio threadpool, letting `async def` route handlers
+    use the sync and async repositories through the same interface.
+    """
+
+    def __init__(self, repo):
+        self._repo = repo
+
+    def __getattr__(self, name):
+        attr = getattr(self._repo, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return await run_in_threadpool(attr, *args, **kwargs)
+
+        return call
@@ -1,17 +1,26 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import User
 from app.schemas import UserCreate, UserUpdate
 from app.core.security import get_password_hash as hash_password
-from typing import Optional, List
-from app.db import SessionLocal
+from app.repositories.base import BaseRepository
+from app.repositories.pagination import Page, keyset, paginate, to_page
+from app.core.cache import user_cache
+from app.core.config import settings
+from typing import Iterable, List, Optional
+from app.db import SessionLocal, AsyncSessionLocal
 
 
-class UserRepository:
+class UserRepository(BaseRepository[User]):
     """
     Repository layer for User model.
     Encapsulates all DB operations for users.
     """
 
+    def __init__(self):
+        super().__init__(User)
+
     # ---------------------------
     # CREATE
     # ---------------------------
@@ -34,13 +43,24 @@ class UserRepository:
     # ---------------------------
     def get_by_id(self, user_id: int) -> Optional[User]:
          with SessionLocal() as session:
+            # Read-only lookup: may use a replica unless this user just wrote.
+            session.set_acting_user(lambda: user_id)
+            session.allow_replica_reads()
             return session.query(User).filter(User.user_id == user_id).first()
 
     def get_by_email(self, db: Session, email: str) -> Optional[User]:
         return db.query(User).filter(User.user_email == email).first()
 
-    def list(self, db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).offset(skip).limit(limit).all()
+    def list(
+        self,
+        db: Session,
+        limit: int = settings.MAX_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[User]:
+        """
+        Fetch one page of users ordered by `user_id` using a keyset cursor.
+        """
+        return paginate(db.query(User), [User.user_id], limit, cursor)
 
     # ---------------------------
     # UPDATE
@@ -53,11 +73,21 @@ class UserRepository:
             user.user_name = user_update.user_name
         if user_update.user_email:
             user.user_email = user_update.user_email
-        if user_update.password:
-            user.password_hash = hash_password(user_update.password)
+        if getattr(user_update, "password", None):
+            user.password = hash_password(user_update.password)
 
         db.commit()
         db.refresh(user)
+        user_cache.invalidate(user.user_id)
+        return user
+
+    def set_password_hash(self, db: Session, user: User, hashed_password: str) -> User:
+        """
+        Store an already computed password hash (used to upgrade the bcrypt cost).
+        """
+        user.password = hashed_password
+        db.commit()
+        user_cache.invalidate(user.user_id)
         return user
 
     # ---------------------------
@@ -66,3 +96,86 @@ class UserRepository:
     def delete(self, db: Session, user: User) -> None:
         db.delete(user)
         db.commit()
+        user_cache.invalidate(user.user_id)
+
+    # ---------------------------
+    # BULK (see BaseRepository; callers commit)
+    # ---------------------------
+    def bulk_update(self, db: Session, rows: List[dict], scope: dict | None = None) -> int:
+        updated = super().bulk_update(db, rows, scope)
+        for row in rows:
+            user_cache.invalidate(row["user_id"])
+        return updated
+
+    def bulk_delete(self, db: Session, ids: Iterable[int], scope: dict | None = None) -> int:
+        ids = set(ids)
+        deleted = super().bulk_delete(db, ids, scope)
+        for user_id in ids:
+            user_cache.invalidate(user_id)
+        return deleted
+
+
+class AsyncUserRepository:
+    """
+    Asyncio counterpart of `UserRepository` backed by an `AsyncSession`.
+    Method names and return values mirror the sync repository.
+    """
+
+    # ---------------------------
+    # CREATE
+    # ---------------------------
+    async def create(self, db: AsyncSession, user_create: UserCreate) -> User:
+        user = User(
+            user_name=user_create.user_name,
+            user_email=user_create.user_email,
+            password=hash_password(user_create.password),
+        )
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+        return user
+
+    # ---------------------------
+    # READ
+    # ---------------------------
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        async with AsyncSessionLocal() as session:
+            return await session.get(User, user_id)
+
+    async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        result = await db.execute(select(User).where(User.user_email == email))
+        return result.scalars().first()
+
+    async def list(
+        self,
+        db: AsyncSession,
+        limit: int = settings.MAX_PAGE_SIZE,
+        cursor: Optional[str] = None,
+    ) -> Page[User]:
+        columns = [User.user_id]
+        rows = (await db.execute(keyset(select(User), columns, limit, cursor))).scalars().all()
+        return to_page(rows, columns, limit)
+
+    # ---------------------------
+    # UPDATE
+    # ---------------------------
+    async def update(self, db: AsyncSession, user: User, user_update: UserUpdate) -> User:
+        if user_update.user_name:
+            user.user_name = user_update.user_name
+        if user_update.user_email:
+            user.user_email = user_update.user_email
+        if getattr(user_update, "password", None):
+            user.password = hash_password(user_update.password)
+
+        await db.commit()
+        await db.refresh(user)
+        user_cache.invalidate(user.user_id)
+        return user
+
+    # ---------------------------
+    # DELETE
+    # ---------------------------
+    async def delete(self, db: AsyncSession, user: User) -> None:
+        await db.delete(user)
+        await db.commit()
+        user_cache.invalidate(user.user_id)
@@ -1,69 +1,249 @@
 # app/routers/notes.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
-from app.core.dependencies import get_current_user,get_db
-from app.schemas import NoteCreate, NoteUpdate, NoteOut
-from app.repositories.note_repository import NoteRepository
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.dependencies import get_current_user, get_db, get_async_db
+from app.core.etag import if_match_versions, make_etag, none_match, version_etag
+from app.schemas import (
+    NoteBulkRequest,
+    NoteBulkResponse,
+    NoteCreate,
+    NoteImportSummary,
+    NoteOut,
+    NotePage,
+    NoteSearchPage,
+    NoteUpdate,
+)
+from app.repositories.note_repository import NoteRepository, AsyncNoteRepository, VersionConflict
+from app.repositories.threaded import ThreadedRepository
+from app.services.export_service import ndjson_stream, ndjson_stream_async
+from app.services.import_service import FORMATS, import_notes, iter_csv, iter_ndjson
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models import User 
 
 router = APIRouter()
 
-# Dependency: repository instance (could later be injected with DB session)
-def get_note_repository(db: Session = Depends(get_db)) -> NoteRepository:
-    return NoteRepository(db)
+# Dependency: repository instance. Handlers always `await` repository calls;
+# the sync repository is run in the threadpool, the async one on the loop.
+if settings.DB_ASYNC:
+    async def get_note_repository(db: AsyncSession = Depends(get_async_db)) -> AsyncNoteRepository:
+        return AsyncNoteRepository(db)
+else:
+    async def get_note_repository(db: Session = Depends(get_db)) -> ThreadedRepository:
+        return ThreadedRepository(NoteRepository(db))
+
+
+def note_etag(note_id: int, version: int) -> str:
+    return version_etag(note_id, version)
 
 
 @router.post("/", response_model=NoteOut, status_code=status.HTTP_201_CREATED)
-def create_note(
+async def create_note(
     note: NoteCreate,
     repo: NoteRepository = Depends(get_note_repository),
     current_user: User = Depends(get_current_user),  # injected current user
 ):
-    created_note = repo.create(note_create=note, user_id=current_user.user_id)
+    created_note = await repo.create(note_create=note, user_id=current_user.user_id)
     return created_note
 
-@router.get("/", response_model=List[NoteOut])
-def list_notes(
+@router.post("/bulk", response_model=NoteBulkResponse)
+async def bulk_notes(
+    batch: NoteBulkRequest,
+    repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Create, update and delete many notes in a single transaction.
+
+    Returns one result per item; updates and deletes of notes that do not
+    exist or belong to another user are reported as `not_found`.
+    """
+    if batch.size > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch exceeds {settings.BULK_MAX_ITEMS} items",
+        )
+    return {"results": await repo.bulk(current_user.user_id, batch)}
+
+@router.post("/import", response_model=NoteImportSummary)
+async def import_notes_stream(
+    request: Request,
+    format: str | None = Query(None, description="ndjson or csv; defaults from Content-Type"),
+    chunk_size: int = Query(settings.IMPORT_CHUNK_SIZE, ge=1, le=10000),
+    repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Import notes from the raw request body, streamed.
+
+    - NDJSON: one `{"title": ..., "body": ...}` object per line
+    - CSV: a header row with `title` and `body` columns
+
+    Rows are committed `chunk_size` at a time. Invalid rows are skipped and
+    reported; they do not abort the import.
+    """
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    if format not in FORMATS:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"Unsupported format, expected one of {', '.join(FORMATS)}")
+
+    parse = iter_csv if format == "csv" else iter_ndjson
+    return await import_notes(
+        parse(request.stream()), repo, current_user.user_id, chunk_size, settings.IMPORT_MAX_ERRORS
+    )
+
+@router.get("/", response_model=NotePage)
+async def list_notes(
+    response: Response,
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    if_none_match: str | None = Header(None),
+    repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Retrieve the current user's notes, newest first, one page at a time.
+
+    - **limit**: Maximum number of notes to return
+    - **cursor**: `next_cursor` from the previous page, omitted for the first page
+
+    Responses carry an ETag derived from a single aggregate over the user's
+    notes; send it back in If-None-Match to get `304 Not Modified`.
+    """
+    fingerprint = await repo.list_fingerprint(current_user.user_id)
+    etag = make_etag("notes", current_user.user_id, *fingerprint, limit, cursor)
+    if none_match(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    try:
+        page = await repo.list_by_user(current_user.user_id, limit, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    response.headers["ETag"] = etag
+    return page
+
+
+@router.get("/search", response_model=NoteSearchPage)
+async def search_notes(
+    q: str = Query(..., min_length=1, max_length=256),
+    limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Full-text search over the current user's note titles and bodies.
+
+    - **q**: Search words; notes matching any of them are ranked by relevance
+    - **limit**: Maximum number of results to return
+    - **cursor**: `next_cursor` from the previous page, omitted for the first page
+    """
+    try:
+        return await repo.search(current_user.user_id, q, limit, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_notes(
+    gzip: bool = Query(False, description="gzip-compress the stream (Content-Encoding: gzip)"),
     repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
 ):
     """
-    Retrieve all notes.
+    Stream all of the current user's notes as newline-delimited JSON,
+    one `NoteOut` object per line, ordered by note_id.
     """
-    return repo.get_all()
+    batches = await repo.iter_export(current_user.user_id)
+    if hasattr(batches, "__aiter__"):
+        body = ndjson_stream_async(batches, gzip)
+    else:
+        body = ndjson_stream(batches, gzip)
+
+    headers = {"Content-Disposition": 'attachment; filename="notes.ndjson"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
 
 
 @router.get("/{note_id}", response_model=NoteOut)
 async def get_note(
     note_id: int,
+    response: Response,
+    if_none_match: str | None = Header(None),
     repo: NoteRepository = Depends(get_note_repository),
 ):
     """
     Retrieve a single note by ID.
+
+    Returns `304 Not Modified` when If-None-Match carries the current ETag;
+    only the note's version is read in that case.
     """
+    if if_none_match:
+        version = await repo.get_version(note_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Note not found")
+        etag = note_etag(note_id, version)
+        if none_match(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     note = await repo.get_by_id(note_id)
     if not note:
         raise HTTPException(status_code=404, detail="Note not found")
+    response.headers["ETag"] = note_etag(note.note_id, note.version)
     return note
 
 
 @router.put("/{note_id}", response_model=NoteOut)
-def update_note(
+async def update_note(
     note_id: int,
     note_update: NoteUpdate,
+    response: Response,
+    if_match: str | None = Header(None),
     repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
 ):
     """
-    Update a note by ID.
+    Update one of the current user's notes by ID.
+
+    With If-Match, the update only applies if the note still has that ETag
+    (otherwise `412 Precondition Failed`). The condition is part of the
+    UPDATE statement, so there is no separate read before the write.
     """
-    updated_note = repo.update( note_id, note_update)
+    try:
+        updated_note = await repo.update(
+            note_id, current_user.user_id, note_update, if_match_versions(if_match, note_id)
+        )
+    except VersionConflict:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED,
+                            detail="Note has been modified")
+    if not updated_note:
+        raise HTTPException(status_code=404, detail="Note not found")
+    response.headers["ETag"] = note_etag(updated_note.note_id, updated_note.version)
     return updated_note
 
 
 @router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_note(note_id: int, repo: NoteRepository = Depends(get_note_repository)):
-    deleted = repo.delete(note_id)
+async def delete_note(
+    note_id: int,
+    if_match: str | None = Header(None),
+    repo: NoteRepository = Depends(get_note_repository),
+    current_user: User = Depends(get_current_user),
+):
+    try:
+        deleted = await repo.delete(
+            note_id, current_user.user_id, if_match_versions(if_match, note_id)
+        )
+    except VersionConflict:
+        raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED,
+                            detail="Note has been modified")
     if not deleted:
         raise HTTPException(status_code=404, detail="Note not found")
-    return {"detail": "Note deleted successfully"}
\ No newline at end of file
+    return {"detail": "Note deleted successfully"}
@@ -14,6 +14,7 @@ Best practices followed:
 
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
+from typing import List
 
 
 # -------------------------
@@ -121,4 +122,106 @@ class NoteOut(NoteBase):
     last_update: datetime | None
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+
+class NotePage(BaseModel):
+    """
+    Schema for one page of notes returned by the list endpoint.
+
+    Pass `next_cursor` back as `cursor` to fetch the following page;
+    it is `None` on the last page.
+    """
+    items: List[NoteOut]
+    next_cursor: str | None = None
+
+    class Config:
+        orm_mode = True
+
+
+class NoteSearchHit(BaseModel):
+    """
+    Schema for a single search result.
+
+    `snippet` is an HTML-escaped excerpt with matching words wrapped in `<mark>`.
+    """
+    note: NoteOut
+    score: float
+    snippet: str
+
+    class Config:
+        orm_mode = True
+
+
+class NoteSearchPage(BaseModel):
+    """
+    Schema for one page of search results, best match first.
+    """
+    items: List[NoteSearchHit]
+    next_cursor: str | None = None
+
+    class Config:
+        orm_mode = True
+
+
+class NoteBulkUpdate(NoteUpdate):
+    """
+    Schema for one update inside a bulk request.
+    """
+    note_id: int
+
+
+class NoteBulkRequest(BaseModel):
+    """
+    Schema for a batch of note writes applied in a single transaction.
+
+    Operations run in the order `create`, `update`, `delete`.
+    """
+    create: List[NoteCreate] = []
+    update: List[NoteBulkUpdate] = []
+    delete: List[int] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.create) + len(self.update) + len(self.delete)
+
+
+class NoteBulkResult(BaseModel):
+    """
+    Outcome of one bulk item.
+
+    `index` is the item's position within its `create`/`update`/`delete` list;
+    `status` is `ok` or `not_found`.
+    """
+    op: str
+    index: int
+    note_id: int | None
+    status: str
+    note: NoteOut | None = None
+
+
+class NoteBulkResponse(BaseModel):
+    """
+    Schema for the per-item results of a bulk request.
+    """
+    results: List[NoteBulkResult]
+
+
+class NoteImportError(BaseModel):
+    """
+    A rejected import row; `line` is the 1-based line where the record starts.
+    """
+    line: int
+    error: str
+
+
+class NoteImportSummary(BaseModel):
+    """
+    Result of a streaming import.
+
+    `errors` lists at most IMPORT_MAX_ERRORS entries; `failed` counts them all.
+    """
+    imported: int
+    failed: int
+    chunks: int
+    errors: List[NoteImportError]
@@ -0,0 +1,26 @@
+# app/search/__init__.py
+
+"""
+Full-text search over note titles and bodies.
+
+`search_backend` is chosen by SEARCH_BACKEND: ``memory`` (in-process
+inverted index, the default) or ``database`` (MySQL FULLTEXT / SQLite FTS5).
+"""
+
+from app.core.config import settings
+from app.search.base import SearchBackend, SearchHit
+from app.search.database import DatabaseSearchBackend
+from app.search.memory import InMemorySearchBackend
+
+
+def build_search_backend() -> SearchBackend:
+    if settings.SEARCH_BACKEND == "database":
+        return DatabaseSearchBackend()
+    return InMemorySearchBackend(
+        ttl=settings.SEARCH_INDEX_TTL, max_users=settings.SEARCH_INDEX_MAX_USERS
+    )
+
+
+search_backend = build_search_backend()
+
+__all__ = ["SearchBackend", "SearchHit", "search_backend", "build_search_backend"]
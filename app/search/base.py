@@ -0,0 +1,102 @@
+# app/search/base.py
+
+"""
+Shared pieces of the note search backends: the backend interface, result
+type, tokenizer and snippet highlighting.
+"""
+
+import html
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Note
+from app.repositories.pagination import Page, encode_cursor, load_cursor
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-cased word tokens; the same rules are used for notes and queries."""
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+@dataclass
+class SearchHit:
+    note: Note
+    score: float
+    snippet: str
+
+
+def make_snippet(text: Optional[str], terms: List[str], width: int = 160) -> str:
+    """
+    Return an HTML-escaped excerpt of `text` around the first matching term,
+    with every matching word wrapped in ``<mark>``.
+    """
+    if not text:
+        return ""
+    wanted = set(terms)
+    matches = [m for m in TOKEN_RE.finditer(text) if m.group().lower() in wanted]
+
+    start = 0
+    if matches and matches[0].start() > width // 4:
+        start = matches[0].start() - width // 4
+    end = min(len(text), start + width)
+
+    parts, pos = [], start
+    for m in matches:
+        if m.start() < start or m.end() > end:
+            continue
+        parts.append(html.escape(text[pos:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group())}</mark>")
+        pos = m.end()
+    parts.append(html.escape(text[pos:end]))
+
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+
+def note_snippet(note: Note, terms: List[str]) -> str:
+    """Snippet from the body when it contains a query term, otherwise from the title."""
+    wanted = set(terms)
+    if note.body and any(t in wanted for t in tokenize(note.body)):
+        return make_snippet(note.body, terms)
+    return make_snippet(note.title, terms)
+
+
+def offset_from_cursor(cursor: Optional[str]) -> int:
+    """Ranked results are paged by position; the offset travels in the usual opaque cursor."""
+    if not cursor:
+        return 0
+    (offset,) = load_cursor(cursor, 1)
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("Invalid pagination cursor")
+    return offset
+
+
+def next_offset_cursor(offset: int, limit: int, has_more: bool) -> Optional[str]:
+    return encode_cursor([offset + limit]) if has_more else None
+
+
+class SearchBackend:
+    """
+    Interface implemented by the search backends.
+
+    `note_saved`/`note_deleted`/`user_changed` are called by `NoteRepository`
+    after each write; backends whose index is maintained by the database ignore them.
+    """
+
+    def note_saved(self, note: Note) -> None:
+        pass
+
+    def note_deleted(self, note_id: int, user_id: int) -> None:
+        pass
+
+    def user_changed(self, user_id: int) -> None:
+        """Many of the user's notes changed at once (e.g. an import)."""
+
+    def search(
+        self, db: Session, user_id: int, query: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[SearchHit]:
+        raise NotImplementedError
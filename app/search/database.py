@@ -0,0 +1,75 @@
+# app/search/database.py
+
+"""
+Search backed by the database's own full-text index.
+
+MySQL uses the FULLTEXT index on ``notes(title, body)``; SQLite (local runs
+and tests) uses the ``notes_fts`` FTS5 table. Both are declared in
+`app.models` and kept current by the database itself, so repository writes
+need no extra work here.
+"""
+
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models import Note
+from app.repositories.pagination import Page
+from app.search.base import (
+    SearchBackend,
+    SearchHit,
+    next_offset_cursor,
+    note_snippet,
+    offset_from_cursor,
+    tokenize,
+)
+
+MYSQL_QUERY = text(
+    "SELECT note_id, MATCH(title, body) AGAINST (:q IN NATURAL LANGUAGE MODE) AS score "
+    "FROM notes "
+    "WHERE user_id = :user_id AND MATCH(title, body) AGAINST (:q IN NATURAL LANGUAGE MODE) "
+    "ORDER BY score DESC, note_id DESC LIMIT :limit OFFSET :offset"
+)
+
+# FTS5 bm25() is lower-is-better; negate it so scores sort like MySQL's.
+SQLITE_QUERY = text(
+    "SELECT notes.note_id, -bm25(notes_fts, 2.0, 1.0) AS score "
+    "FROM notes_fts JOIN notes ON notes.note_id = notes_fts.rowid "
+    "WHERE notes_fts MATCH :q AND notes.user_id = :user_id "
+    "ORDER BY score DESC, notes.note_id DESC LIMIT :limit OFFSET :offset"
+)
+
+
+class DatabaseSearchBackend(SearchBackend):
+    def search(
+        self, db: Session, user_id: int, query: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[SearchHit]:
+        offset = offset_from_cursor(cursor)
+        terms = tokenize(query)
+        if not terms:
+            return Page(items=[])
+
+        if db.get_bind().dialect.name == "sqlite":
+            # Quote every term so user input is never parsed as FTS5 syntax.
+            statement, q = SQLITE_QUERY, " OR ".join(f'"{t}"' for t in terms)
+        else:
+            statement, q = MYSQL_QUERY, " ".join(terms)
+
+        rows = db.execute(
+            statement, {"q": q, "user_id": user_id, "limit": limit + 1, "offset": offset}
+        ).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        notes = {}
+        if rows:
+            ids = [row.note_id for row in rows]
+            notes = {n.note_id: n for n in db.query(Note).filter(Note.note_id.in_(ids))}
+
+        hits = [
+            SearchHit(note=notes[row.note_id], score=round(float(row.score), 4), snippet=note_snippet(notes[row.note_id], terms))
+            for row in rows
+            if row.note_id in notes
+        ]
+        return Page(items=hits, next_cursor=next_offset_cursor(offset, limit, has_more))
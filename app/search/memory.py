@@ -0,0 +1,177 @@
+# app/search/memory.py
+
+"""
+In-process inverted index with BM25 ranking.
+
+Each user gets a separate index, so a query only touches the postings of
+that user's notes and its cost depends on how many of them contain the query
+terms, not on the total number of notes. A user's index is built from the
+database on their first search and then kept up to date from
+`NoteRepository` writes. The index lives in one process: with several
+workers, loaded indexes are rebuilt after `ttl` seconds to pick up writes
+made elsewhere, and at most `max_users` indexes are kept (LRU).
+"""
+
+import heapq
+import math
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import Note
+from app.repositories.pagination import Page
+from app.search.base import (
+    SearchBackend,
+    SearchHit,
+    note_snippet,
+    next_offset_cursor,
+    offset_from_cursor,
+    tokenize,
+)
+
+# Standard BM25 parameters; title words count twice as much as body words.
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+
+
+def _term_frequencies(title: Optional[str], body: Optional[str]) -> Counter:
+    tf = Counter(tokenize(body))
+    for token in tokenize(title):
+        tf[token] += TITLE_WEIGHT
+    return tf
+
+
+class _UserIndex:
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self.doc_terms: Dict[int, Counter] = {}
+        self.doc_len: Dict[int, int] = {}
+        self.total_len = 0
+        self.loaded_at = time.monotonic()
+
+    def add(self, note_id: int, title: Optional[str], body: Optional[str]) -> None:
+        self.remove(note_id)
+        tf = _term_frequencies(title, body)
+        for term, count in tf.items():
+            self.postings[term][note_id] = count
+        self.doc_terms[note_id] = tf
+        length = sum(tf.values())
+        self.doc_len[note_id] = length
+        self.total_len += length
+
+    def remove(self, note_id: int) -> None:
+        tf = self.doc_terms.pop(note_id, None)
+        if tf is None:
+            return
+        for term in tf:
+            docs = self.postings[term]
+            docs.pop(note_id, None)
+            if not docs:
+                del self.postings[term]
+        self.total_len -= self.doc_len.pop(note_id)
+
+    def score(self, terms) -> Dict[int, float]:
+        n_docs = len(self.doc_len)
+        if not n_docs:
+            return {}
+        avg_len = self.total_len / n_docs or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(terms):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for note_id, tf in docs.items():
+                norm = tf + K1 * (1 - B + B * self.doc_len[note_id] / avg_len)
+                scores[note_id] += idf * tf * (K1 + 1) / norm
+        return scores
+
+
+class InMemorySearchBackend(SearchBackend):
+    def __init__(self, ttl: float = 300.0, max_users: int = 1000):
+        self.ttl = ttl
+        self.max_users = max_users
+        self._users: "OrderedDict[int, _UserIndex]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    # ---------------------------
+    # Index maintenance
+    # ---------------------------
+    def note_saved(self, note: Note) -> None:
+        with self._lock:
+            index = self._users.get(note.user_id)
+            # Users whose index is not loaded are picked up on their next search.
+            if index is not None:
+                index.add(note.note_id, note.title, note.body)
+
+    def note_deleted(self, note_id: int, user_id: int) -> None:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None:
+                index.remove(note_id)
+
+    def user_changed(self, user_id: int) -> None:
+        # Cheaper to rebuild on the next search than to apply a bulk change.
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def _load(self, db: Session, user_id: int) -> _UserIndex:
+        with self._lock:
+            index = self._users.get(user_id)
+            if index is not None and time.monotonic() - index.loaded_at < self.ttl:
+                self._users.move_to_end(user_id)
+                return index
+
+        index = _UserIndex()
+        rows = (
+            db.query(Note.note_id, Note.title, Note.body)
+            .filter(Note.user_id == user_id)
+            .yield_per(1000)
+        )
+        for note_id, title, body in rows:
+            index.add(note_id, title, body)
+
+        with self._lock:
+            self._users[user_id] = index
+            self._users.move_to_end(user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+        return index
+
+    # ---------------------------
+    # Query
+    # ---------------------------
+    def search(
+        self, db: Session, user_id: int, query: str, limit: int, cursor: Optional[str] = None
+    ) -> Page[SearchHit]:
+        offset = offset_from_cursor(cursor)
+        terms = tokenize(query)
+        if not terms:
+            return Page(items=[])
+
+        index = self._load(db, user_id)
+        with self._lock:
+            scores = index.score(terms)
+        ranked = heapq.nlargest(
+            offset + limit + 1, scores.items(), key=lambda item: (item[1], item[0])
+        )
+        window = ranked[offset:offset + limit]
+
+        notes = {}
+        if window:
+            ids = [note_id for note_id, _ in window]
+            notes = {
+                n.note_id: n
+                for n in db.query(Note).filter(Note.user_id == user_id, Note.note_id.in_(ids))
+            }
+
+        hits = [
+            SearchHit(note=notes[note_id], score=round(score, 4), snippet=note_snippet(notes[note_id], terms))
+            for note_id, score in window
+            if note_id in notes
+        ]
+        return Page(items=hits, next_cursor=next_offset_cursor(offset, limit, len(ranked) > offset + limit))
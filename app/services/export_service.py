@@ -0,0 +1,59 @@
+"""
+NDJSON encoding for the note export stream.
+
+Rows arrive in batches from `NoteRepository.iter_export` (a sync iterator) or
+`AsyncNoteRepository.iter_export` (an async iterator). Each batch is encoded
+to one chunk of JSON lines and, optionally, gzip-compressed on the fly, so
+neither the full row list nor the full response body is ever held in memory.
+"""
+
+import json
+import zlib
+from typing import AsyncIterator, Iterable, Iterator, Optional
+
+
+def encode_note_line(row) -> str:
+    """One `NoteOut`-shaped JSON object per line."""
+    return json.dumps({
+        "title": row.title,
+        "body": row.body,
+        "note_id": row.note_id,
+        "user_id": row.user_id,
+        "created_on": row.created_on.isoformat() if row.created_on else None,
+        "last_update": row.last_update.isoformat() if row.last_update else None,
+    }, ensure_ascii=False) + "\n"
+
+
+class _Encoder:
+    def __init__(self, gzip: bool):
+        # wbits=31 writes a gzip header/trailer instead of a raw zlib stream.
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+
+    def batch(self, rows) -> bytes:
+        data = "".join(encode_note_line(row) for row in rows).encode()
+        return self._compressor.compress(data) if self._compressor else data
+
+    def finish(self) -> Optional[bytes]:
+        return self._compressor.flush() if self._compressor else None
+
+
+def ndjson_stream(batches: Iterable, gzip: bool = False) -> Iterator[bytes]:
+    encoder = _Encoder(gzip)
+    for rows in batches:
+        chunk = encoder.batch(rows)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
+
+
+async def ndjson_stream_async(batches: AsyncIterator, gzip: bool = False) -> AsyncIterator[bytes]:
+    encoder = _Encoder(gzip)
+    async for rows in batches:
+        chunk = encoder.batch(rows)
+        if chunk:
+            yield chunk
+    tail = encoder.finish()
+    if tail:
+        yield tail
@@ -0,0 +1,138 @@
+"""
+Streaming note import (NDJSON or CSV).
+
+The request body is consumed chunk by chunk and split into records without
+ever holding the whole upload, so files larger than RAM are fine. Records
+are validated against `NoteCreate` and written `chunk_size` rows per
+transaction. A bad row is reported and skipped, and a chunk that fails to
+commit is reported as a whole; neither aborts the rest of the import.
+"""
+
+import csv
+import json
+import logging
+from typing import AsyncIterator, List, Tuple
+
+from pydantic import ValidationError
+
+from app.schemas import NoteCreate
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("ndjson", "csv")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """Split a byte stream into (line_number, text) pairs, 1-based."""
+    pending = b""
+    line_no = 0
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for raw in lines:
+            line_no += 1
+            yield line_no, _decode(raw, line_no)
+    if pending:
+        line_no += 1
+        yield line_no, _decode(pending, line_no)
+
+
+def _decode(raw: bytes, line_no: int) -> str:
+    # Strip a UTF-8 BOM on the first line; undecodable bytes become U+FFFD.
+    return raw.decode("utf-8-sig" if line_no == 1 else "utf-8", errors="replace").rstrip("\r")
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    async for line_no, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as exc:
+            yield line_no, exc
+
+
+async def iter_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Parse CSV with a header row. A record continues onto the next line while
+    it has an odd number of quote characters (a newline inside a quoted field).
+    """
+    header = None
+    record, start = [], 0
+    async for line_no, line in iter_lines(chunks):
+        if not record:
+            start = line_no
+        record.append(line)
+        text = "\n".join(record)
+        if text.count('"') % 2:
+            continue
+        record = []
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as exc:
+            yield start, exc
+            continue
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        yield start, dict(zip(header, values))
+    if record:
+        yield start, ValueError("Unterminated quoted field")
+
+
+def _error(line_no: int, exc: Exception) -> dict:
+    if isinstance(exc, ValidationError):
+        message = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+    else:
+        message = str(exc)
+    return {"line": line_no, "error": message}
+
+
+async def import_notes(records, repo, user_id: int, chunk_size: int, max_errors: int) -> dict:
+    """
+    Validate `records` and insert them through `repo.import_chunk`, one
+    transaction per `chunk_size` valid rows. Returns a summary with the first
+    `max_errors` errors; all failures are counted.
+    """
+    summary = {"imported": 0, "failed": 0, "chunks": 0, "errors": []}
+
+    def fail(line_no, exc):
+        summary["failed"] += 1
+        if len(summary["errors"]) < max_errors:
+            summary["errors"].append(_error(line_no, exc))
+
+    async def flush(batch: List[Tuple[int, NoteCreate]]):
+        try:
+            await repo.import_chunk(user_id, [note for _, note in batch])
+        except Exception as exc:
+            logger.warning(f"Import chunk for user {user_id} failed: {exc}")
+            for line_no, _ in batch:
+                fail(line_no, exc)
+            return
+        summary["imported"] += len(batch)
+        summary["chunks"] += 1
+        logger.info(
+            f"Import for user {user_id}: chunk {summary['chunks']} committed, "
+            f"imported={summary['imported']} failed={summary['failed']}"
+        )
+
+    batch: List[Tuple[int, NoteCreate]] = []
+    async for line_no, record in records:
+        if isinstance(record, Exception):
+            fail(line_no, record)
+            continue
+        try:
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object")
+            batch.append((line_no, NoteCreate.parse_obj(record)))
+        except (ValidationError, ValueError) as exc:
+            fail(line_no, exc)
+            continue
+        if len(batch) >= chunk_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+    return summary
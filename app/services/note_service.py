@@ -11,8 +11,8 @@ class NoteService:
     def create_note(self, db: Session, note_create: NoteCreate, user_id: int):
         return self.note_repository.create(db, note_create, user_id)
 
-    def get_user_notes(self, db: Session, user_id: int):
-        return self.note_repository.list_by_user(db, user_id)
+    def get_user_notes(self, db: Session, user_id: int, limit: int, cursor: str | None = None):
+        return self.note_repository.list_by_user(user_id, limit, cursor)
 
     def update_note(self, db: Session, note, note_update: NoteUpdate):
         return self.note_repository.update(db, note, note_update)
@@ -1,7 +1,11 @@
 from sqlalchemy.orm import Session
 from app.repositories.user_repository import UserRepository
 from app.schemas import UserCreate
-from app.core.security import verify_password
+import logging
+from app.core.hashing import HashingQueueFull
+from app.core.security import get_password_hash, password_needs_rehash, verify_password
+
+logger = logging.getLogger(__name__)
 
 class UserService:
     """Business logic for Users"""
@@ -14,10 +18,21 @@ class UserService:
         return self.user_repository.create(db, user_create)
 
     def authenticate_user(self, db: Session, email: str, password: str):
-        """Validate user credentials"""
+        """
+        Validate user credentials.
+
+        On success, a stored hash with an outdated bcrypt cost is transparently
+        replaced, so BCRYPT_ROUNDS can change without forcing password resets.
+        """
         user = self.user_repository.get_by_email(db, email)
         if not user:
             return None
         if not verify_password(password, user.password):
             return None
+        if password_needs_rehash(user.password):
+            try:
+                self.user_repository.set_password_hash(db, user, get_password_hash(password))
+            except HashingQueueFull:
+                # Best effort: the login itself already succeeded.
+                logger.info("Skipped password rehash for user %s: hashing queue full", user.user_id)
         return user
@@ -2,14 +2,24 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 from app.main import app
-from app.core.database import Base, get_db
+from app.db import Base
+from app.core.dependencies import get_db, get_current_user
+from app.models import Note, User
 
 # Use in-memory SQLite for tests
 SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# StaticPool shares the single in-memory connection with the TestClient's threadpool
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 # Override DB dependency
 def override_get_db():
@@ -36,3 +46,20 @@ def db_session():
 @pytest.fixture(scope="function")
 def client():
     return TestClient(app)
+
+@pytest.fixture(scope="function")
+def auth_client(db_session):
+    """
+    TestClient authenticated as a fresh user; yields (client, user).
+    """
+    user = User(user_name="Tester", user_email="tester@test.com", password="x")
+    db_session.add(user)
+    db_session.commit()
+    app.dependency_overrides[get_current_user] = lambda: user
+    try:
+        yield TestClient(app), user
+    finally:
+        app.dependency_overrides.pop(get_current_user, None)
+        db_session.query(Note).delete()
+        db_session.query(User).delete()
+        db_session.commit()
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db import Base
+from app.repositories.note_repository import AsyncNoteRepository
+from app.repositories.user_repository import AsyncUserRepository
+from app.schemas import NoteCreate, NoteUpdate, UserCreate
+
+
+async def _exercise_repositories():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    AsyncTestingSession = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with AsyncTestingSession() as db:
+        user = await AsyncUserRepository().create(
+            db, UserCreate(user_name="Async", user_email="async@test.com", password="secret123")
+        )
+        assert (await AsyncUserRepository().get_by_email(db, "async@test.com")).user_id == user.user_id
+
+        repo = AsyncNoteRepository(db)
+        created = [await repo.create(NoteCreate(title=f"n{i}"), user.user_id) for i in range(3)]
+
+        page = await repo.list_by_user(user.user_id, limit=2)
+        rest = await repo.list_by_user(user.user_id, limit=2, cursor=page.next_cursor)
+        assert len(page.items) + len(rest.items) == 3
+        assert rest.next_cursor is None
+
+        updated = await repo.update(created[0].note_id, user.user_id, NoteUpdate(title="renamed"))
+        assert updated.title == "renamed"
+        assert updated.version == 2
+        # Writes are scoped to the owner.
+        assert await repo.update(created[0].note_id, user.user_id + 1, NoteUpdate(title="x")) is None
+
+        assert await repo.delete(created[1].note_id, user.user_id + 1) is False
+        assert await repo.delete(created[1].note_id, user.user_id) is True
+        assert await repo.get_by_id(created[1].note_id) is None
+        assert await repo.delete(created[1].note_id, user.user_id) is False
+
+    await engine.dispose()
+
+
+def test_async_repositories_crud():
+    asyncio.run(_exercise_repositories())
@@ -0,0 +1,45 @@
+from app.core.config import settings
+from app.models import Note, User
+
+
+def test_bulk_applies_all_operations(auth_client, db_session):
+    client, user = auth_client
+    other = User(user_name="Other", user_email="bulk-other@test.com", password="x")
+    db_session.add(other)
+    db_session.commit()
+    mine = Note(title="old", body="keep", user_id=user.user_id)
+    doomed = Note(title="bye", user_id=user.user_id)
+    foreign = Note(title="not yours", user_id=other.user_id)
+    db_session.add_all([mine, doomed, foreign])
+    db_session.commit()
+
+    response = client.post("/api/notes/bulk", json={
+        "create": [{"title": "a"}, {"title": "b", "body": "bee"}],
+        "update": [
+            {"note_id": mine.note_id, "title": "new"},
+            {"note_id": foreign.note_id, "title": "hijack"},
+        ],
+        "delete": [doomed.note_id, foreign.note_id],
+    })
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(r["op"], r["status"]) for r in results] == [
+        ("create", "ok"), ("create", "ok"),
+        ("update", "ok"), ("update", "not_found"),
+        ("delete", "ok"), ("delete", "not_found"),
+    ]
+    assert results[1]["note"]["body"] == "bee"
+    assert results[1]["note"]["created_on"] is not None
+    assert results[2]["note"] == {**results[2]["note"], "title": "new", "body": "keep"}
+
+    db_session.expire_all()
+    titles = {n.title for n in db_session.query(Note).filter(Note.user_id == user.user_id)}
+    assert titles == {"a", "b", "new"}
+    assert db_session.get(Note, foreign.note_id).title == "not yours"
+
+
+def test_bulk_rejects_oversized_batch(auth_client):
+    client, _ = auth_client
+    batch = {"create": [{"title": str(i)} for i in range(settings.BULK_MAX_ITEMS + 1)]}
+    assert client.post("/api/notes/bulk", json=batch).status_code == 413
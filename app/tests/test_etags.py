@@ -0,0 +1,45 @@
+def _create(client, title="first"):
+    return client.post("/api/notes/", json={"title": title, "body": "text"}).json()
+
+
+def test_get_note_304_and_etag_changes_on_update(auth_client):
+    client, _ = auth_client
+    note = _create(client)
+    url = f"/api/notes/{note['note_id']}"
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+    cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    updated = client.put(url, json={"title": "changed"})
+    assert updated.headers["etag"] != etag
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_304_until_notes_change(auth_client):
+    client, _ = auth_client
+    note = _create(client)
+
+    etag = client.get("/api/notes/").headers["etag"]
+    assert client.get("/api/notes/", headers={"If-None-Match": etag}).status_code == 304
+    # A different page is a different representation.
+    assert client.get("/api/notes/?limit=5", headers={"If-None-Match": etag}).status_code == 200
+
+    client.put(f"/api/notes/{note['note_id']}", json={"title": "changed"})
+    assert client.get("/api/notes/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_match_guards_writes(auth_client):
+    client, _ = auth_client
+    note = _create(client)
+    url = f"/api/notes/{note['note_id']}"
+    stale = client.get(url).headers["etag"]
+
+    fresh = client.put(url, json={"title": "v2"}, headers={"If-Match": stale}).headers["etag"]
+
+    assert client.put(url, json={"title": "v3"}, headers={"If-Match": stale}).status_code == 412
+    assert client.delete(url, headers={"If-Match": stale}).status_code == 412
+    assert client.delete(url, headers={"If-Match": fresh}).status_code == 204
+    assert client.delete(url, headers={"If-Match": fresh}).status_code == 404
@@ -0,0 +1,46 @@
+import gzip
+import json
+
+from app.models import Note
+from app.repositories.note_repository import NoteRepository
+
+
+def _seed(db_session, user, count):
+    db_session.add_all([Note(title=f"t{i}", body="é" * i, user_id=user.user_id) for i in range(count)])
+    db_session.commit()
+
+
+def test_export_streams_ndjson(auth_client, db_session):
+    client, user = auth_client
+    _seed(db_session, user, 5)
+    db_session.add(Note(title="foreign", user_id=user.user_id + 1000))
+    db_session.commit()
+
+    response = client.get("/api/notes/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == [f"t{i}" for i in range(5)]
+    assert lines[3]["body"] == "ééé"
+    assert set(lines[0]) == {"title", "body", "note_id", "user_id", "created_on", "last_update"}
+
+
+def test_export_gzip(auth_client, db_session):
+    client, user = auth_client
+    _seed(db_session, user, 3)
+
+    # Read the raw bytes so the client does not transparently decompress.
+    with client.stream("GET", "/api/notes/export?gzip=true") as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(gzip.decompress(raw).decode().splitlines()) == 3
+
+
+def test_iter_export_batches(db_session, auth_client):
+    _, user = auth_client
+    _seed(db_session, user, 5)
+
+    batches = list(NoteRepository(db_session).iter_export(user.user_id, batch_size=2))
+    assert [len(b) for b in batches] == [2, 2, 1]
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from app.core import security
+from app.core.hashing import HashingExecutor, HashingQueueFull
+from app.models import User
+from app.repositories.user_repository import UserRepository
+from app.services.user_service import UserService
+
+
+def test_executor_fails_fast_when_queue_is_full():
+    executor = HashingExecutor(workers=0, queue_size=1, timeout=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait()
+        return "done"
+
+    worker = threading.Thread(target=executor.run, args=(slow,))
+    worker.start()
+    started.wait()
+
+    with pytest.raises(HashingQueueFull):
+        executor.submit(len, "x")
+
+    release.set()
+    worker.join()
+    assert executor.run(len, "abc") == 3  # slot released after completion
+
+
+def test_login_rehashes_outdated_cost(db_session):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("secret123")
+    user = User(user_name="Old", user_email="old-cost@test.com", password=old_hash)
+    db_session.add(user)
+    db_session.commit()
+    assert security.password_needs_rehash(old_hash)
+
+    service = UserService(UserRepository())
+    assert service.authenticate_user(db_session, "old-cost@test.com", "secret123") is not None
+
+    db_session.refresh(user)
+    assert user.password != old_hash
+    assert not security.password_needs_rehash(user.password)
+    assert security.verify_password("secret123", user.password)
+
+
+def test_signup_returns_503_when_hashing_is_saturated(client, monkeypatch):
+    def saturated(fn, *args):
+        raise HashingQueueFull("Password hashing queue is full")
+
+    monkeypatch.setattr(security.hash_executor, "submit", saturated)
+
+    response = client.post(
+        "/api/auth/signup",
+        json={"user_name": "Busy", "user_email": "busy@test.com", "password": "secret123"},
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,49 @@
+from app.models import Note
+
+
+def _titles(db_session, user):
+    db_session.expire_all()
+    return [n.title for n in db_session.query(Note).filter(Note.user_id == user.user_id).order_by(Note.note_id)]
+
+
+def test_import_ndjson_reports_bad_rows(auth_client, db_session):
+    client, user = auth_client
+    body = "\n".join([
+        '{"title": "one", "body": "first"}',
+        "not json",
+        '{"body": "missing title"}',
+        "",
+        '{"title": "two"}',
+        '{"title": "three"}',
+    ])
+
+    response = client.post(
+        "/api/notes/import?chunk_size=2",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert (summary["imported"], summary["failed"], summary["chunks"]) == (3, 2, 2)
+    assert [e["line"] for e in summary["errors"]] == [2, 3]
+    assert "title" in summary["errors"][1]["error"]
+    assert _titles(db_session, user) == ["one", "two", "three"]
+
+
+def test_import_csv_with_multiline_field(auth_client, db_session):
+    client, user = auth_client
+    body = 'title,body\r\nplain,text\r\n"quoted, title","line one\nline ""two"""\r\n'
+
+    response = client.post(
+        "/api/notes/import", content=body.encode(), headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.json()["imported"] == 2
+    note = db_session.query(Note).filter(Note.title == "quoted, title").one()
+    assert note.body == 'line one\nline "two"'
+
+
+def test_import_rejects_unknown_format(auth_client):
+    client, _ = auth_client
+    assert client.post("/api/notes/import?format=xml", content=b"").status_code == 400
@@ -0,0 +1,54 @@
+from prometheus_client.parser import text_string_to_metric_families
+
+from app.core.metrics import instrument_engine
+
+
+def _samples(client):
+    response = client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    return {
+        (s.name, tuple(sorted(s.labels.items()))): s.value
+        for family in text_string_to_metric_families(response.text)
+        for s in family.samples
+    }
+
+
+def test_requests_recorded_by_route_template(auth_client):
+    client, _ = auth_client
+    note = client.post("/api/notes/", json={"title": "a", "body": "b"}).json()
+    before = _samples(client)
+    key = (
+        "http_requests_total",
+        (("method", "GET"), ("route", "/api/notes/{note_id}"), ("status", "200")),
+    )
+
+    client.get(f"/api/notes/{note['note_id']}")
+    client.get(f"/api/notes/{note['note_id']}")
+    client.get("/no/such/path")
+    after = _samples(client)
+
+    assert after[key] - before.get(key, 0) == 2
+    assert (
+        "http_request_duration_seconds_count",
+        (("method", "GET"), ("route", "/api/notes/{note_id}")),
+    ) in after
+    assert (
+        "http_requests_total",
+        (("method", "GET"), ("route", "<unmatched>"), ("status", "404")),
+    ) in after
+
+
+def test_db_statements_and_pool_recorded(auth_client, db_session):
+    client, _ = auth_client
+    engine = db_session.get_bind()
+    instrument_engine(engine, "test")
+    instrument_engine(engine, "test")  # second call is a no-op
+
+    insert = ("db_query_duration_seconds_count", (("engine", "test"), ("operation", "INSERT")))
+    before = _samples(client).get(insert, 0)
+    client.post("/api/notes/", json={"title": "a", "body": "b"})
+    samples = _samples(client)
+
+    assert samples[insert] - before == 1
+    assert samples[("db_pool_checked_out", (("engine", "test"),))] >= 0
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models import Note, User
+from app.repositories.note_repository import NoteRepository
+from app.repositories.user_repository import UserRepository
+
+
+@pytest.fixture
+def owner(db_session):
+    user = User(user_name="Pager", user_email="pager@test.com", password="x")
+    other = User(user_name="Other", user_email="other@test.com", password="x")
+    db_session.add_all([user, other])
+    db_session.commit()
+
+    base = datetime(2024, 1, 1, 12, 0, 0)
+    # Several notes share a timestamp so the note_id tie-breaker is exercised.
+    for i in range(7):
+        db_session.add(Note(title=f"n{i}", user_id=user.user_id, created_on=base + timedelta(minutes=i // 3)))
+    db_session.add(Note(title="foreign", user_id=other.user_id, created_on=base))
+    db_session.commit()
+
+    yield user
+
+    db_session.query(Note).delete()
+    db_session.query(User).delete()
+    db_session.commit()
+
+
+def test_list_by_user_walks_all_pages(db_session, owner):
+    repo = NoteRepository(db_session)
+
+    seen, cursor = [], None
+    while True:
+        page = repo.list_by_user(owner.user_id, limit=3, cursor=cursor)
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert [n.title for n in seen] == ["n6", "n5", "n4", "n3", "n2", "n1", "n0"]
+    assert all(n.user_id == owner.user_id for n in seen)
+
+
+def test_list_by_user_rejects_bad_cursor(db_session, owner):
+    repo = NoteRepository(db_session)
+    with pytest.raises(ValueError):
+        repo.list_by_user(owner.user_id, limit=3, cursor="not-a-cursor")
+
+
+def test_user_list_uses_cursor(db_session, owner):
+    repo = UserRepository()
+
+    first = repo.list(db_session, limit=1)
+    second = repo.list(db_session, limit=1, cursor=first.next_cursor)
+
+    assert first.items[0].user_id < second.items[0].user_id
+    assert second.next_cursor is None
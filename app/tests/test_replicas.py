@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.replicas import ReplicaRouter, RoutingSession, recent_writers
+from app.db import Base
+from app.models import Note, User
+
+
+@pytest.fixture
+def databases(tmp_path):
+    """
+    A primary and two "replicas", each a separate SQLite file holding one
+    user whose name says which database served the read.
+    """
+    engines = {}
+    for name in ("primary", "replica0", "replica1"):
+        engine = create_engine(f"sqlite:///{tmp_path / name}.sqlite3")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            db.add(User(user_id=1, user_name=name, user_email="u@test.com", password="x"))
+            db.commit()
+        engines[name] = engine
+    recent_writers.clear()
+    yield engines
+    recent_writers.clear()
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _session(engines, router, user_id=1, read_only=True):
+    db = sessionmaker(bind=engines["primary"], class_=RoutingSession, router=router)()
+    db.set_acting_user(lambda: user_id)
+    if read_only:
+        db.allow_replica_reads()
+    return db
+
+
+def _served_by(db):
+    return db.query(User.user_name).filter(User.user_id == 1).scalar()
+
+
+def test_round_robin_reads_and_primary_writes(databases):
+    router = ReplicaRouter([databases["replica0"], databases["replica1"]])
+
+    served = []
+    for _ in range(4):
+        with _session(databases, router, user_id=None) as db:
+            served.append(_served_by(db))
+    assert served == ["replica0", "replica1", "replica0", "replica1"]
+
+    with _session(databases, router, read_only=False) as db:
+        assert _served_by(db) == "primary"
+
+
+def test_write_pins_session_and_user_reads_own_writes(databases):
+    router = ReplicaRouter([databases["replica0"], databases["replica1"]])
+
+    with _session(databases, router) as db:
+        assert _served_by(db) in ("replica0", "replica1")
+        db.add(Note(user_id=1, title="new"))
+        db.commit()
+        # Later reads in the same session see the write.
+        assert db.query(Note).count() == 1
+
+    # The writer reads from the primary for the read-your-writes window...
+    with _session(databases, router, user_id=1) as db:
+        assert _served_by(db) == "primary"
+    # ...other users still use the replicas.
+    with _session(databases, router, user_id=2) as db:
+        assert _served_by(db) in ("replica0", "replica1")
+
+
+def test_least_connections_prefers_idle_replica(databases):
+    router = ReplicaRouter(
+        [databases["replica0"], databases["replica1"]], strategy="least_connections"
+    )
+    with databases["replica0"].connect():
+        assert router.in_use(databases["replica0"]) == 1
+        for _ in range(3):
+            with _session(databases, router) as db:
+                assert _served_by(db) == "replica1"
+
+
+def test_failed_replica_is_ejected_until_it_recovers(databases, tmp_path):
+    now = [0.0]
+    broken = create_engine(f"sqlite:///{tmp_path}/missing/dir/replica.sqlite3")
+    router = ReplicaRouter([broken], eject_seconds=30, clock=lambda: now[0])
+
+    with _session(databases, router) as db:
+        with pytest.raises(Exception):
+            _served_by(db)
+    assert router.healthy() == []
+
+    # With no healthy replica, reads fall back to the primary.
+    with _session(databases, router) as db:
+        assert _served_by(db) == "primary"
+
+    now[0] = 31.0
+    assert router.healthy() == [broken]
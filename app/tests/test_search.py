@@ -0,0 +1,76 @@
+import pytest
+
+from app.models import Note, User
+from app.repositories.note_repository import NoteRepository
+from app.schemas import NoteCreate, NoteUpdate
+from app.search import base as search_base
+from app.search.base import make_snippet
+from app.search.database import DatabaseSearchBackend
+from app.search.memory import InMemorySearchBackend
+
+
+@pytest.fixture
+def users(db_session):
+    alice = User(user_name="Alice", user_email="search-alice@test.com", password="x")
+    bob = User(user_name="Bob", user_email="search-bob@test.com", password="x")
+    db_session.add_all([alice, bob])
+    db_session.commit()
+    db_session.add_all([
+        Note(title="Grocery list", body="milk eggs bread", user_id=alice.user_id),
+        Note(title="Trip", body="pack the milk frother and passport", user_id=alice.user_id),
+        Note(title="Milk", body="milk milk milk", user_id=alice.user_id),
+        Note(title="Bob's milk", body="milk", user_id=bob.user_id),
+    ])
+    db_session.commit()
+
+    yield alice, bob
+
+    db_session.query(Note).delete()
+    db_session.query(User).delete()
+    db_session.commit()
+
+
+@pytest.mark.parametrize("backend", [InMemorySearchBackend(), DatabaseSearchBackend()])
+def test_search_ranks_and_scopes_by_user(db_session, users, backend):
+    alice, _ = users
+
+    page = backend.search(db_session, alice.user_id, "milk", limit=10)
+
+    titles = [hit.note.title for hit in page.items]
+    assert titles[0] == "Milk"
+    assert sorted(titles) == ["Grocery list", "Milk", "Trip"]
+    assert all(hit.note.user_id == alice.user_id for hit in page.items)
+    assert "<mark>milk</mark>" in page.items[0].snippet
+
+
+@pytest.mark.parametrize("backend", [InMemorySearchBackend(), DatabaseSearchBackend()])
+def test_search_paginates(db_session, users, backend):
+    alice, _ = users
+
+    first = backend.search(db_session, alice.user_id, "milk", limit=2)
+    second = backend.search(db_session, alice.user_id, "milk", limit=2, cursor=first.next_cursor)
+
+    assert len(first.items) == 2 and len(second.items) == 1
+    assert second.next_cursor is None
+
+
+def test_memory_index_follows_repository_writes(db_session, users, monkeypatch):
+    alice, _ = users
+    backend = InMemorySearchBackend()
+    monkeypatch.setattr("app.repositories.note_repository.search_backend", backend)
+    repo = NoteRepository(db_session)
+    assert repo.search(alice.user_id, "kayak").items == []  # loads the index
+
+    note = repo.create(NoteCreate(title="Weekend", body="rent a kayak"), alice.user_id)
+    assert [h.note.note_id for h in repo.search(alice.user_id, "kayak").items] == [note.note_id]
+
+    repo.update(note.note_id, alice.user_id, NoteUpdate(title="Weekend", body="rent a canoe"))
+    assert repo.search(alice.user_id, "kayak").items == []
+
+    repo.delete(note.note_id, alice.user_id)
+    assert repo.search(alice.user_id, "canoe").items == []
+
+
+def test_snippet_is_escaped_and_highlighted():
+    snippet = make_snippet("<b>Milk</b> & honey", search_base.tokenize("milk"))
+    assert snippet == "&lt;b&gt;<mark>Milk</mark>&lt;/b&gt; &amp; honey"
@@ -0,0 +1,65 @@
+from app.core.cache import SQLiteInvalidationBackend, TTLCache, user_cache
+from app.models import User
+from app.repositories.user_repository import UserRepository
+from app.schemas import UserCreate, UserUpdate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_counters():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set(1, "a")
+    cache.set(2, "b")
+    assert cache.get(1) == "a"  # 1 becomes most recently used
+    cache.set(3, "c")  # evicts 2
+
+    assert cache.get(2) is None
+    assert cache.get(3) == "c"
+    assert cache.stats() == {
+        "size": 2, "maxsize": 2, "hits": 2, "misses": 1, "evictions": 1, "expirations": 0,
+    }
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("k", "v")
+
+    clock.now = 4.9
+    assert cache.get("k") == "v"
+    clock.now = 5.0
+    assert cache.get("k") is None
+    assert cache.expirations == 1
+
+
+def test_invalidations_are_shared_through_backend(tmp_path):
+    path = str(tmp_path / "invalidations.sqlite3")
+    worker_a = TTLCache(maxsize=10, ttl=60, backend=SQLiteInvalidationBackend(path), sync_interval=0)
+    worker_b = TTLCache(maxsize=10, ttl=60, backend=SQLiteInvalidationBackend(path), sync_interval=0)
+    worker_a.set(7, "user")
+    worker_b.set(7, "user")
+
+    worker_b.invalidate(7)
+
+    assert worker_a.get(7) is None
+    assert worker_b.get(7) is None
+
+
+def test_user_update_invalidates_cached_user(db_session):
+    repo = UserRepository()
+    user = repo.create(db_session, UserCreate(user_name="Cached", user_email="cached@test.com", password="secret123"))
+    user_cache.set(user.user_id, user)
+
+    repo.update(db_session, user, UserUpdate(user_name="Renamed"))
+    assert user_cache.get(user.user_id) is None
+
+    user_cache.set(user.user_id, user)
+    repo.delete(db_session, user)
+    assert user_cache.get(user.user_id) is None
+    assert db_session.query(User).filter(User.user_id == user.user_id).first() is None
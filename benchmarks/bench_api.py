@@ -0,0 +1,319 @@
+"""
+End-to-end API load benchmark.
+
+Seeds a synthetic dataset (see `benchmarks.dataset`), then drives signup,
+login, /api/auth/me and note create/get/update/list/delete either through
+the app in-process (`--driver asgi`, no sockets) or through real uvicorn
+worker processes (`--driver uvicorn`). Reports throughput and p50/p95/p99
+latency per endpoint as JSON.
+
+    python -m benchmarks.bench_api --users 50 --notes 200 --requests 500
+    python -m benchmarks.bench_api --driver uvicorn --workers 4 --save-baseline baseline.json
+    python -m benchmarks.bench_api --baseline baseline.json   # exits 1 on regression
+
+Signup and login are answered with 503 once more than HASH_QUEUE_SIZE
+password hashes are in flight (see `error_statuses`); raise it or lower
+--concurrency to measure them without load shedding.
+
+Runs offline against a temporary SQLite file by default; pass
+--database-url for MySQL (it must be reachable and the email prefix unused).
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+SCENARIOS = ("signup", "login", "me", "create", "get", "update", "list", "delete")
+
+
+# ------------------------------------------------------------------------------
+# Measurement
+# ------------------------------------------------------------------------------
+def summarize(latencies: List[float], errors: Dict[int, int], elapsed: float) -> dict:
+    ms = sorted(v * 1000 for v in latencies)
+    if len(ms) >= 2:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ms[0] if ms else 0.0
+    return {
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "error_statuses": {str(code): n for code, n in sorted(errors.items())},
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(p95, 3),
+        "p99_ms": round(p99, 3),
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    make_request: Callable[[int], tuple],
+    requests: int,
+    concurrency: int,
+    on_response: Optional[Callable] = None,
+) -> dict:
+    """
+    Send `requests` requests built by `make_request(i)` -> (method, url, kwargs)
+    from `concurrency` concurrent workers.
+    """
+    latencies: List[float] = []
+    errors: Dict[int, int] = {}
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            method, url, kwargs = make_request(i)
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.is_error:
+                errors[response.status_code] = errors.get(response.status_code, 0) + 1
+            elif on_response:
+                on_response(i, response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def run_all(client, users: List[dict], note_ids: Dict[int, List[int]], args) -> dict:
+    from app.core.security import create_access_token
+
+    run_id = uuid.uuid4().hex[:8]
+    headers = [
+        {"Authorization": f"Bearer {create_access_token({'user_id': u['user_id']})}"} for u in users
+    ]
+    ids = [note_ids[u["user_id"]] for u in users]
+    created: Dict[int, int] = {}
+
+    def user(i):
+        return i % len(users)
+
+    def seeded_note(i):
+        owner = user(i)
+        return owner, ids[owner][(i // len(users)) % len(ids[owner])]
+
+    def note_request(method, i, **kwargs):
+        owner, note_id = seeded_note(i)
+        return method, f"/api/notes/{note_id}", {"headers": headers[owner], **kwargs}
+
+    builders = {
+        "signup": lambda i: ("POST", "/api/auth/signup", {"json": {
+            "user_name": "Signup", "user_email": f"{run_id}-signup-{i}@example.com", "password": "benchpass",
+        }}),
+        "login": lambda i: ("POST", "/api/auth/login", {"json": {
+            "user_email": users[user(i)]["user_email"], "password": users[user(i)]["password"],
+        }}),
+        "me": lambda i: ("GET", "/api/auth/me", {"headers": headers[user(i)]}),
+        "create": lambda i: ("POST", "/api/notes/", {
+            "headers": headers[user(i)], "json": {"title": f"created {i}", "body": "created by bench_api"},
+        }),
+        "get": lambda i: note_request("GET", i),
+        "update": lambda i: note_request("PUT", i, json={"title": f"updated {i}"}),
+        "list": lambda i: ("GET", "/api/notes/", {"headers": headers[user(i)], "params": {"limit": 20}}),
+    }
+
+    def remember_created(i, response):
+        created[i] = response.json()["note_id"]
+
+    results = {}
+    for name in args.scenarios:
+        requests = args.requests
+        if name in ("signup", "login"):
+            requests = min(requests, args.auth_requests)
+        if name == "delete":
+            # Deletes the notes made by "create", so the dataset is unchanged afterwards.
+            made = sorted(created)
+            requests = len(made)
+            if not requests:
+                continue
+            builders["delete"] = lambda i: (
+                "DELETE", f"/api/notes/{created[made[i]]}", {"headers": headers[user(made[i])]}
+            )
+        results[name] = await run_scenario(
+            client, builders[name], requests, args.concurrency,
+            on_response=remember_created if name == "create" else None,
+        )
+    return results
+
+
+# ------------------------------------------------------------------------------
+# Drivers
+# ------------------------------------------------------------------------------
+async def drive_asgi(users, note_ids, args) -> dict:
+    from app.main import app
+
+    # Keep per-request log lines out of the measurement and the output.
+    logging.getLogger("app.main").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        return await run_all(client, users, note_ids, args)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def drive_uvicorn(users, note_ids, args) -> dict:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--log-level", "warning", "--no-access-log",
+        ],
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    if (await client.get("/api/health")).status_code == 200:
+                        break
+                except httpx.TransportError:
+                    pass
+                if server.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("uvicorn did not start")
+                await asyncio.sleep(0.2)
+            return await run_all(client, users, note_ids, args)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+# ------------------------------------------------------------------------------
+# Baseline comparison
+# ------------------------------------------------------------------------------
+def compare(result: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    Compare per-endpoint p95 latency and throughput with `baseline`. An
+    endpoint regresses when p95 grows, or throughput drops, by more than
+    `tolerance` (a fraction).
+    """
+    comparison = {}
+    for name, current in result["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(name)
+        if not base:
+            continue
+        p95_change = (current["p95_ms"] - base["p95_ms"]) / base["p95_ms"] if base["p95_ms"] else 0.0
+        rps_change = (
+            (current["throughput_rps"] - base["throughput_rps"]) / base["throughput_rps"]
+            if base["throughput_rps"] else 0.0
+        )
+        comparison[name] = {
+            "p95_change_pct": round(p95_change * 100, 1),
+            "throughput_change_pct": round(rps_change * 100, 1),
+            "regressed": p95_change > tolerance or rps_change < -tolerance,
+        }
+    return comparison
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite file")
+    parser.add_argument("--driver", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument("--workers", type=int, default=2, help="uvicorn worker processes")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--notes", type=int, default=100, help="seeded notes per user")
+    parser.add_argument("--body-size", default="fixed:200", help="see benchmarks.dataset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--auth-requests", type=int, default=50,
+                        help="requests for signup/login, which are bounded by bcrypt")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--baseline", help="compare with this stored result")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression (fraction)")
+    parser.add_argument("--save-baseline", help="write this result to the given file")
+    args = parser.parse_args()
+
+    url = args.database_url
+    if url is None:
+        url = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench_api.sqlite3")
+    # Must be set before the app (and its engine) is imported, here and in
+    # the uvicorn workers, which inherit the environment.
+    os.environ["DATABASE_URL"] = url
+
+    from sqlalchemy import create_engine, select
+
+    from app.models import Note
+    from benchmarks.dataset import seed
+
+    engine = create_engine(url)
+    seed_start = time.perf_counter()
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    users = seed(engine, args.users, args.notes, args.body_size, args.seed, prefix=prefix)
+    seed_seconds = time.perf_counter() - seed_start
+
+    note_ids: Dict[int, List[int]] = {}
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(Note.user_id, Note.note_id).where(Note.user_id.in_([u["user_id"] for u in users]))
+        )
+        for user_id, note_id in rows:
+            note_ids.setdefault(user_id, []).append(note_id)
+    engine.dispose()
+    if any(not note_ids.get(u["user_id"]) for u in users):
+        parser.error("--notes must be at least 1")
+
+    drive = drive_asgi if args.driver == "asgi" else drive_uvicorn
+    endpoints = asyncio.run(drive(users, note_ids, args))
+
+    result = {
+        "driver": args.driver,
+        "workers": args.workers if args.driver == "uvicorn" else 1,
+        "database": url.split(":", 1)[0],
+        "dataset": {
+            "users": args.users, "notes_per_user": args.notes,
+            "body_size": args.body_size, "seed": args.seed, "seed_seconds": round(seed_seconds, 3),
+        },
+        "concurrency": args.concurrency,
+        "endpoints": endpoints,
+    }
+    regressed = False
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        for key in ("driver", "workers", "database", "dataset", "concurrency"):
+            if key == "dataset":
+                differs = {k: v for k, v in baseline.get(key, {}).items() if k != "seed_seconds"} != {
+                    k: v for k, v in result[key].items() if k != "seed_seconds"
+                }
+            else:
+                differs = baseline.get(key) != result[key]
+            if differs:
+                print(f"warning: baseline was run with a different {key}", file=sys.stderr)
+        result["comparison"] = compare(result, baseline, args.tolerance)
+        regressed = any(c["regressed"] for c in result["comparison"].values())
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(result, f, indent=2)
+
+    print(json.dumps(result, indent=2))
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Overhead benchmark for the request logging/metrics middleware.
+
+Drives a minimal FastAPI app directly through ASGI (no sockets, no HTTP
+client) with and without `LoggingMiddleware` and reports the per-request
+difference as JSON. Log output is suppressed unless --log is given, so the
+default figure is the metrics bookkeeping alone:
+
+    python -m benchmarks.bench_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+from fastapi import FastAPI
+
+from app.main import LoggingMiddleware
+
+
+def build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"item_id": item_id}
+
+    if with_middleware:
+        app.add_middleware(LoggingMiddleware)
+    return app
+
+
+async def drive(app, requests: int) -> float:
+    """Send `requests` GETs through `app`; return seconds per request."""
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    def scope(i):
+        path = f"/items/{i}"
+        return {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+            "root_path": "", "query_string": b"", "headers": [],
+            "client": ("127.0.0.1", 1234), "server": ("127.0.0.1", 8000),
+        }
+
+    for i in range(min(requests, 500)):  # warm-up
+        await app(scope(i), receive, send)
+    start = time.perf_counter()
+    for i in range(requests):
+        await app(scope(i), receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def run(requests: int, rounds: int) -> dict:
+    plain, instrumented = build_app(False), build_app(True)
+    # Best of `rounds` for each variant, interleaved to share any drift.
+    base, with_mw = float("inf"), float("inf")
+    for _ in range(rounds):
+        base = min(base, asyncio.run(drive(plain, requests)))
+        with_mw = min(with_mw, asyncio.run(drive(instrumented, requests)))
+    return {
+        "requests": requests,
+        "rounds": rounds,
+        "baseline_us": round(base * 1e6, 2),
+        "middleware_us": round(with_mw * 1e6, 2),
+        "overhead_us": round((with_mw - base) * 1e6, 2),
+        "overhead_pct": round((with_mw - base) / base * 100, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--log", action="store_true", help="include the per-request log line")
+    args = parser.parse_args()
+
+    if not args.log:
+        logging.getLogger("app.main").setLevel(logging.WARNING)
+    print(json.dumps(run(args.requests, args.rounds), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Synthetic dataset generator for the benchmarks.
+
+Seeds N users x M notes with executemany INSERTs, in batches, from a fixed
+random seed, so two runs with the same arguments produce the same data.
+Note body sizes follow a configurable distribution:
+
+    fixed:200          every body is 200 characters
+    uniform:50-5000    uniformly distributed between 50 and 5000
+    lognormal:500      log-normal with median 500 (a few very large notes)
+
+    python -m benchmarks.dataset --users 100 --notes 1000 --body-size lognormal:500
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import tempfile
+import time
+from typing import Callable, List
+
+from sqlalchemy import create_engine, insert, select
+
+from app.core.security import pwd_context
+from app.db import Base
+from app.models import Note, User
+
+PASSWORD = "benchpass"
+MAX_BODY_SIZE = 60000  # stays under MySQL's 64 KiB TEXT limit
+
+_vocabulary_rng = random.Random(0)
+_WORDS = [
+    "".join(_vocabulary_rng.choices(string.ascii_lowercase, k=_vocabulary_rng.randint(2, 10)))
+    for _ in range(512)
+]
+
+
+def body_sizes(spec: str) -> Callable[[random.Random], int]:
+    """Parse a body-size spec (see the module docstring) into a sampler."""
+    kind, _, arg = spec.partition(":")
+    if kind == "fixed":
+        size = int(arg)
+        return lambda rng: size
+    if kind == "uniform":
+        low, high = (int(v) for v in arg.split("-"))
+        return lambda rng: rng.randint(low, high)
+    if kind == "lognormal":
+        median = float(arg)
+        return lambda rng: min(MAX_BODY_SIZE, max(1, int(rng.lognormvariate(0, 1) * median)))
+    raise ValueError(f"Unknown body size spec: {spec!r}")
+
+
+def make_text(rng: random.Random, size: int) -> str:
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def seed(
+    engine,
+    users: int,
+    notes_per_user: int,
+    body_size: str = "fixed:200",
+    random_seed: int = 42,
+    batch_size: int = 5000,
+    prefix: str = "bench",
+) -> List[dict]:
+    """
+    Create the schema if needed and insert the dataset. Returns the seeded
+    users as dicts with user_id, user_email and password (all share one
+    bcrypt hash, computed once).
+    """
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(random_seed)
+    sizes = body_sizes(body_size)
+    password_hash = pwd_context.hash(PASSWORD)
+    emails = [f"{prefix}-{i}@example.com" for i in range(users)]
+
+    ids = {}
+    with engine.begin() as conn:
+        # Small batches keep the IN list under SQLite's bound-parameter limit.
+        for start in range(0, users, 500):
+            batch = emails[start:start + 500]
+            conn.execute(insert(User.__table__), [
+                {"user_name": f"Bench User {start + i}", "user_email": email, "password": password_hash}
+                for i, email in enumerate(batch)
+            ])
+            ids.update(conn.execute(
+                select(User.user_email, User.user_id).where(User.user_email.in_(batch))
+            ).all())
+
+    rows = []
+    with engine.begin() as conn:
+        for email in emails:
+            for _ in range(notes_per_user):
+                rows.append({
+                    "user_id": ids[email],
+                    "title": make_text(rng, rng.randint(10, 60)),
+                    "body": make_text(rng, sizes(rng)),
+                })
+                if len(rows) >= batch_size:
+                    conn.execute(insert(Note.__table__), rows)
+                    rows = []
+        if rows:
+            conn.execute(insert(Note.__table__), rows)
+
+    return [{"user_id": ids[e], "user_email": e, "password": PASSWORD} for e in emails]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=None, help="defaults to a temporary SQLite file")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--notes", type=int, default=100, help="notes per user")
+    parser.add_argument("--body-size", default="fixed:200")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="bench", help="email prefix; must be unused in the database")
+    args = parser.parse_args()
+
+    url = args.database_url or "sqlite:///" + os.path.join(tempfile.mkdtemp(), "bench.sqlite3")
+    engine = create_engine(url)
+    start = time.perf_counter()
+    seed(engine, args.users, args.notes, args.body_size, args.seed, prefix=args.prefix)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "database_url": url,
+        "users": args.users,
+        "notes": args.users * args.notes,
+        "body_size": args.body_size,
+        "seconds": round(elapsed, 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()